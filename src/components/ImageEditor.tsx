@@ -6,6 +6,7 @@ import FloatingWindow from './FloatingWindow'
 import type { Viewpoint } from '../entities/viewpoint'
 import { useConfirm } from './ConfirmDialog'
 import { projectToPixel } from '../utils/projection'
+import { quaternionToMatrix } from '../optimization/math-utils-common'
 import { computeVanishingPoint, collectDirectionConstrainedLines, VPLineData } from '../optimization/vanishing-points'
 import { VanishingLineAxis } from '../entities/vanishing-line'
 
@@ -32,6 +33,7 @@ export const ImageEditor: React.FC<ImageEditorProps> = observer(({
     let squaredSum = 0
     let count = 0
 
+    const rotationMatrix = quaternionToMatrix(viewpoint.rotation)
     for (const ip of viewpoint.imagePoints) {
       let dx: number | null = null
       let dy: number | null = null
@@ -47,7 +49,7 @@ export const ImageEditor: React.FC<ImageEditorProps> = observer(({
         const xyz = optimizationInfo.optimizedXyz ?? wp.getEffectiveXyz()
         if (xyz && xyz[0] !== null && xyz[1] !== null && xyz[2] !== null) {
           try {
-            const proj = projectToPixel([xyz[0], xyz[1], xyz[2]], viewpoint)
+            const proj = projectToPixel([xyz[0], xyz[1], xyz[2]], viewpoint, rotationMatrix)
 
             if (proj) {
               dx = proj.u - ip.u
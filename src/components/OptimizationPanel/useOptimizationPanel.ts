@@ -7,6 +7,7 @@ import { useOptimization } from '../../hooks/useOptimization'
 import { defaultOptimizationSettings } from '../../services/optimization'
 import { initializeCameraWithPnP } from '../../optimization/pnp'
 import { projectToPixel } from '../../utils/projection'
+import { quaternionToMatrix } from '../../optimization/math-utils-common'
 import { ProjectDB } from '../../services/project-db'
 import { checkOptimizationReadiness } from '../../optimization/optimization-readiness'
 import { setLogCallback, getSolveQuality, getBestResidualSoFar, getCandidateProgress } from '../../optimization/optimize-project'
@@ -100,6 +101,7 @@ interface OptimizationSettings {
 function computeCameraReprojectionError(vp: Viewpoint): number {
   let totalError = 0
   let count = 0
+  const rotationMatrix = quaternionToMatrix(vp.rotation)
 
   for (const ip of vp.imagePoints) {
     const wp = ip.worldPoint
@@ -107,7 +109,7 @@ function computeCameraReprojectionError(vp: Viewpoint): number {
 
     try {
       const optimizedXyz = wp.getOptimizationInfo().optimizedXyz!
-      const projected = projectToPixel(optimizedXyz, vp)
+      const projected = projectToPixel(optimizedXyz, vp, rotationMatrix)
 
       if (projected) {
         const dx = projected.u - ip.u
@@ -127,12 +127,23 @@ export function useWorldPointPanel({
     return []
   }
 
+  // Reverse index from world point to the constraints involving it, built once
+  // per render instead of scanning every constraint for every listed point
+  const constraintsByWorldPoint = new Map<WorldPoint, Constraint[]>()
+  for (const constraint of constraints) {
+    for (const p of new Set(getConstraintPoints(constraint))) {
+      const involved = constraintsByWorldPoint.get(p)
+      if (involved) {
+        involved.push(constraint)
+      } else {
+        constraintsByWorldPoint.set(p, [constraint])
+      }
+    }
+  }
+
   // Find constraints involving a world point
   const getConstraintsForWorldPoint = (wp: WorldPoint): Constraint[] => {
-    return constraints.filter(constraint => {
-      const constraintPoints = getConstraintPoints(constraint)
-      return constraintPoints.some(p => p === wp)
-    })
+    return constraintsByWorldPoint.get(wp) ?? []
   }
 
   // Check if world point has any broken constraints
@@ -140,7 +151,7 @@ export function useWorldPointPanel({
     const wpConstraints = getConstraintsForWorldPoint(wp)
     return wpConstraints.some(constraint => {
       const constraintPoints = getConstraintPoints(constraint)
-      return constraintPoints.some(p => !Array.from(worldPoints.values()).includes(p))
+      return constraintPoints.some(p => !worldPoints.has(p))
     })
   }
 
@@ -133,6 +133,16 @@ export class Serialization {
     )
   }
 
+  /**
+   * Returns serialized project data with the project name replaced.
+   * The data is migrated to the current format on the way through, as a full
+   * deserialize/serialize would, but no entity graph is built.
+   */
+  static renameSerialized(json: string, name: string): string {
+    const dto = migrateProject(JSON.parse(json) as ProjectDto)
+    return JSON.stringify({ ...dto, name }, roundingReplacer, 2)
+  }
+
   static saveToLocalStorage(project: Project, key: string = 'Rotera-project'): void {
     const json = this.serialize(project)
     localStorage.setItem(key, json)
@@ -196,4 +196,50 @@ describe('Serialization Integration Tests', () => {
     expect(parsed.worldPoints[0]).toHaveProperty('id')
     expect(parsed.worldPoints[0]).toHaveProperty('name')
   })
+
+  test('stripDataUrls blanks only embedded data URLs', () => {
+    const project = Project.create('Images')
+    project.addViewpoint(Viewpoint.create('Embedded', 'a.jpg', 'data:image/jpeg;base64,AAAA', 1920, 1080))
+    project.addViewpoint(Viewpoint.create('Remote', 'b.jpg', 'https://example.com/b.jpg', 1920, 1080))
+
+    const parsed = JSON.parse(Serialization.serialize(project, { stripDataUrls: true }))
+    const urls = parsed.viewpoints.map((vp: { name: string; url: string }) => [vp.name, vp.url])
+
+    expect(urls).toEqual([['Embedded', ''], ['Remote', 'https://example.com/b.jpg']])
+  })
+
+  test('renameSerialized replaces the name and keeps the content', () => {
+    const project = Project.create('Old Name')
+    const p1 = WorldPoint.create('P1', { lockedXyz: [0, 0, 0] })
+    const p2 = WorldPoint.create('P2', { lockedXyz: [1, 0, 0] })
+    project.addWorldPoint(p1)
+    project.addWorldPoint(p2)
+    project.addLine(Line.create('L1', p1, p2, { direction: 'x' }))
+
+    const renamed = Serialization.deserialize(Serialization.renameSerialized(Serialization.serialize(project), 'New Name'))
+
+    expect(renamed.name).toBe('New Name')
+    expect(renamed.worldPoints.size).toBe(2)
+    expect(Array.from(renamed.lines)[0].direction).toBe('x')
+  })
+
+  test('renameSerialized migrates old-format data', () => {
+    const project = Project.create('Legacy')
+    const p1 = WorldPoint.create('P1', { lockedXyz: [0, 0, 0] })
+    const p2 = WorldPoint.create('P2', { lockedXyz: [0, 1, 0] })
+    project.addWorldPoint(p1)
+    project.addWorldPoint(p2)
+    project.addLine(Line.create('L1', p1, p2, { direction: 'y' }))
+
+    // Rewrite as a v0 project, which used 'vertical' for Y-aligned lines
+    const v0 = JSON.parse(Serialization.serialize(project))
+    delete v0.formatVersion
+    v0.lines[0].direction = 'vertical'
+
+    const parsed = JSON.parse(Serialization.renameSerialized(JSON.stringify(v0), 'Renamed'))
+
+    expect(parsed.name).toBe('Renamed')
+    expect(parsed.formatVersion).toBeGreaterThanOrEqual(1)
+    expect(parsed.lines[0].direction).toBe('y')
+  })
 })
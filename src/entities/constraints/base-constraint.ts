@@ -15,6 +15,16 @@ export function getPointCoordinates(point: WorldPoint): [number, number, number]
   return point.optimizedXyz
 }
 
+// True if any element appears more than once; stops at the first repeat
+export function hasDuplicates<T>(items: readonly T[]): boolean {
+  const seen = new Set<T>()
+  for (const item of items) {
+    if (seen.has(item)) return true
+    seen.add(item)
+  }
+  return false
+}
+
 // Forward declaration for Plane
 export interface IPlane extends ISelectable {
   getName(): string
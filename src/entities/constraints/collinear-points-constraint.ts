@@ -7,7 +7,8 @@ import type { WorldPoint } from '../world-point/WorldPoint'
 import {
   Constraint,
   type ConstraintEvaluation,
-  getPointCoordinates
+  getPointCoordinates,
+  hasDuplicates
 } from './base-constraint'
 import type { SerializationContext } from '../serialization/SerializationContext'
 import type { CollinearPointsConstraintDto } from './ConstraintDto'
@@ -99,8 +100,7 @@ export class CollinearPointsConstraint extends Constraint {
     }
 
     // Check for duplicate points
-    const uniquePoints = new Set(this.points)
-    if (uniquePoints.size !== this.points.length) {
+    if (hasDuplicates(this.points)) {
       errors.push(ValidationHelpers.createError(
         'DUPLICATE_POINTS',
         'Collinear points constraint cannot have duplicate points',
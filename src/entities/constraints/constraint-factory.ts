@@ -15,31 +15,32 @@ import { EqualDistancesConstraint } from './equal-distances-constraint'
 import { EqualAnglesConstraint } from './equal-angles-constraint'
 import { ProjectionConstraint } from './projection-constraint'
 
+type ConstraintType = ConstraintDto['type']
+
+type ConstraintDeserializer<T extends ConstraintType> = (
+  dto: Extract<ConstraintDto, { type: T }>,
+  context: SerializationContext
+) => Constraint
+
+// One lookup per DTO instead of walking a switch. The mapped type keeps the
+// table exhaustive: adding a DTO type without an entry is a compile error.
+const CONSTRAINT_DESERIALIZERS: { readonly [T in ConstraintType]: ConstraintDeserializer<T> } = {
+  distance_point_point: DistanceConstraint.deserialize,
+  angle_point_point_point: AngleConstraint.deserialize,
+  parallel_lines: ParallelLinesConstraint.deserialize,
+  perpendicular_lines: PerpendicularLinesConstraint.deserialize,
+  fixed_point: FixedPointConstraint.deserialize,
+  collinear_points: CollinearPointsConstraint.deserialize,
+  coplanar_points: CoplanarPointsConstraint.deserialize,
+  equal_distances: EqualDistancesConstraint.deserialize,
+  equal_angles: EqualAnglesConstraint.deserialize,
+  projection: ProjectionConstraint.deserialize,
+}
+
 export function deserializeConstraint(dto: ConstraintDto, context: SerializationContext): Constraint {
-  switch (dto.type) {
-    case 'distance_point_point':
-      return DistanceConstraint.deserialize(dto, context)
-    case 'angle_point_point_point':
-      return AngleConstraint.deserialize(dto, context)
-    case 'parallel_lines':
-      return ParallelLinesConstraint.deserialize(dto, context)
-    case 'perpendicular_lines':
-      return PerpendicularLinesConstraint.deserialize(dto, context)
-    case 'fixed_point':
-      return FixedPointConstraint.deserialize(dto, context)
-    case 'collinear_points':
-      return CollinearPointsConstraint.deserialize(dto, context)
-    case 'coplanar_points':
-      return CoplanarPointsConstraint.deserialize(dto, context)
-    case 'equal_distances':
-      return EqualDistancesConstraint.deserialize(dto, context)
-    case 'equal_angles':
-      return EqualAnglesConstraint.deserialize(dto, context)
-    case 'projection':
-      return ProjectionConstraint.deserialize(dto, context)
-    default: {
-      const exhaustiveCheck: never = dto
-      throw new Error(`Unknown constraint type: ${(exhaustiveCheck as ConstraintDto).type}`)
-    }
+  const deserialize = CONSTRAINT_DESERIALIZERS[dto.type] as ConstraintDeserializer<ConstraintType> | undefined
+  if (!deserialize) {
+    throw new Error(`Unknown constraint type: ${dto.type}`)
   }
+  return deserialize(dto, context)
 }
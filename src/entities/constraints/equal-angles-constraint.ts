@@ -5,6 +5,7 @@ import { ValidationHelpers } from '../../validation/validator'
 import type { WorldPoint } from '../world-point/WorldPoint'
 import type { SerializationContext } from '../serialization/SerializationContext'
 import type { EqualAnglesConstraintDto } from './ConstraintDto'
+import { hasDuplicates } from './base-constraint'
 import { EqualityConstraintBase } from './equality-constraint-base'
 
 export class EqualAnglesConstraint extends EqualityConstraintBase<[WorldPoint, WorldPoint, WorldPoint]> {
@@ -89,8 +90,7 @@ export class EqualAnglesConstraint extends EqualityConstraintBase<[WorldPoint, W
         ))
       } else {
         // Check for duplicate points within the triplet
-        const uniquePoints = new Set(triplet)
-        if (uniquePoints.size !== 3) {
+        if (hasDuplicates(triplet)) {
           errors.push(ValidationHelpers.createError(
             'DUPLICATE_POINTS_IN_TRIPLET',
             `Angle triplet ${i} cannot have duplicate points`,
@@ -85,7 +85,7 @@ export class FixedPointConstraint extends Constraint {
       ))
     } else {
       for (let i = 0; i < 3; i++) {
-        if (typeof this.targetXyz[i] !== 'number' || !isFinite(this.targetXyz[i])) {
+        if (!Number.isFinite(this.targetXyz[i])) {
           errors.push(ValidationHelpers.createError(
             'INVALID_TARGET_COORDINATE',
             `targetXyz[${i}] must be a finite number`,
@@ -1,5 +1,7 @@
 export interface SerializationOptions {
   excludeImages?: boolean
+  /** Blank only embedded data: URLs (images stored elsewhere), keeping other URLs */
+  stripDataUrls?: boolean
 }
 
 export class SerializationContext {
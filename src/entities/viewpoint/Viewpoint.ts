@@ -512,7 +512,10 @@ export class Viewpoint implements ISelectable, IOptimizableCamera, IViewpoint, I
             id: this.id,
             name: this.name,
             filename: this.filename,
-            url: context.options.excludeImages ? '' : this.url,
+            url: context.options.excludeImages ||
+                (context.options.stripDataUrls && this.url.startsWith('data:'))
+                ? ''
+                : this.url,
             imageWidth: this.imageWidth,
             imageHeight: this.imageHeight,
             focalLength: this.focalLength,
@@ -111,8 +111,10 @@ export class WorldPoint implements ISelectable, IWorldPoint, ISerializable<World
     }
 
     isFullyConstrained(): boolean {
-        const effective = this.getEffectiveXyz()
-        return effective.every(v => v !== null)
+        // Same as checking getEffectiveXyz(), without allocating the tuple
+        return (this.lockedXyz[0] ?? this.inferredXyz[0]) !== null &&
+            (this.lockedXyz[1] ?? this.inferredXyz[1]) !== null &&
+            (this.lockedXyz[2] ?? this.inferredXyz[2]) !== null
     }
 
     getConstraintStatus(): 'free' | 'partial' | 'inferred' | 'locked' {
@@ -382,8 +384,9 @@ export class WorldPoint implements ISelectable, IWorldPoint, ISerializable<World
     // Utility methods
     // ============================================================================
 
-    applyOptimizationResult(result: { xyz: [number, number, number], residual?: number }): void {
-        this.optimizedXyz = [...result.xyz] as [number , number , number ]
+    applyOptimizationResult(result: { readonly xyz: readonly [number, number, number], residual?: number }): void {
+        // Observable assignment already stores its own copy of the tuple
+        this.optimizedXyz = result.xyz as [number, number, number]
     }
 
     /**
@@ -397,14 +400,15 @@ export class WorldPoint implements ISelectable, IWorldPoint, ISerializable<World
     ): void {
         const indices = getIndices()
 
-        const xLocked = this.isXLocked()
-        const yLocked = this.isYLocked()
-        const zLocked = this.isZLocked()
+        // Effective (locked or inferred) value per axis, read once; null means free
+        const ex = this.lockedXyz[0] ?? this.inferredXyz[0]
+        const ey = this.lockedXyz[1] ?? this.inferredXyz[1]
+        const ez = this.lockedXyz[2] ?? this.inferredXyz[2]
 
         const xyz: [number, number, number] = [
-            xLocked ? (this.lockedXyz[0] ?? this.inferredXyz[0]!) : (indices[0] >= 0 ? variables[indices[0]] : getLockedValue('x')!),
-            yLocked ? (this.lockedXyz[1] ?? this.inferredXyz[1]!) : (indices[1] >= 0 ? variables[indices[1]] : getLockedValue('y')!),
-            zLocked ? (this.lockedXyz[2] ?? this.inferredXyz[2]!) : (indices[2] >= 0 ? variables[indices[2]] : getLockedValue('z')!)
+            ex ?? (indices[0] >= 0 ? variables[indices[0]] : getLockedValue('x')!),
+            ey ?? (indices[1] >= 0 ? variables[indices[1]] : getLockedValue('y')!),
+            ez ?? (indices[2] >= 0 ? variables[indices[2]] : getLockedValue('z')!)
         ]
 
         this.applyOptimizationResult({xyz})
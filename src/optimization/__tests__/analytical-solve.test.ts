@@ -5,6 +5,7 @@
  */
 
 import { transparentLM } from '../autodiff-dense-lm';
+import type { AnalyticalResidualProvider } from '../analytical/types';
 import { ConstraintSystem } from '../constraint-system/ConstraintSystem';
 import { WorldPoint } from '../../entities/world-point/WorldPoint';
 import { Line } from '../../entities/line/Line';
@@ -182,6 +183,41 @@ describe('Analytical Solve', () => {
     });
   });
 
+  describe('providers with all variables locked', () => {
+    it('evaluates them once and keeps their residuals in the result', () => {
+      let constantCalls = 0;
+      const providers: AnalyticalResidualProvider[] = [
+        {
+          variableIndices: [-1],
+          computeResidual: () => {
+            constantCalls++;
+            return 3;
+          },
+          computeGradient: () => new Float64Array([0]),
+        },
+        {
+          variableIndices: [0],
+          computeResidual: (vars) => vars[0] - 1,
+          computeGradient: () => new Float64Array([1]),
+        },
+      ];
+
+      const result = transparentLM(new Float64Array([4]), null, {
+        analyticalProviders: providers,
+        maxIterations: 20,
+        costTolerance: 1e-12,
+        paramTolerance: 1e-12,
+        gradientTolerance: 1e-10,
+      });
+
+      expect(result.variableValues[0]).toBeCloseTo(1, 8);
+      expect(result.finalCost).toBeCloseTo(9, 8);
+      expect(result.residualValues[0]).toBe(3);
+      // Once before iterating, once for the final residuals
+      expect(constantCalls).toBe(2);
+    });
+  });
+
   describe('sparse solve with analytical', () => {
     it('solves with sparse CG and analytical providers', () => {
       const pointA = WorldPoint.create('A', { lockedXyz: [0, 0, 0] });
@@ -1,4 +1,8 @@
-import { accumulateNormalEquations } from '../accumulate-normal-equations';
+import {
+  accumulateNormalEquations,
+  buildNormalEquationsPattern,
+  createNormalEquationsBuffers,
+} from '../accumulate-normal-equations';
 import { AnalyticalResidualProvider } from '../types';
 
 describe('accumulateNormalEquations', () => {
@@ -170,4 +174,69 @@ describe('accumulateNormalEquations', () => {
     expect(result.negJtr[0]).toBe(-1);
     expect(result.negJtr[1]).toBe(-2);
   });
+
+  it('matches the COO path when reusing a precomputed pattern', () => {
+    // Overlapping, non-contiguous and locked indices
+    const providers: AnalyticalResidualProvider[] = [
+      {
+        variableIndices: [3, 0, -1],
+        computeResidual: (vars) => 2 * vars[3] - vars[0],
+        computeGradient: () => new Float64Array([2, -1, 5]),
+      },
+      {
+        variableIndices: [0, 2],
+        computeResidual: (vars) => vars[0] * vars[2] - 1,
+        computeGradient: (vars) => new Float64Array([vars[2], vars[0]]),
+      },
+      {
+        variableIndices: [2, 3, 0],
+        computeResidual: (vars) => vars[2] + vars[3] + vars[0],
+        computeGradient: () => new Float64Array([1, 1, 1]),
+      },
+    ];
+    const pattern = buildNormalEquationsPattern(providers, 4);
+
+    for (const variables of [new Float64Array([1, 0, 2, 3]), new Float64Array([-0.5, 7, 4, 1])]) {
+      const coo = accumulateNormalEquations(variables, providers, 4);
+      const cached = accumulateNormalEquations(variables, providers, 4, pattern);
+
+      expect(cached.cost).toBe(coo.cost);
+      expect(Array.from(cached.negJtr)).toEqual(Array.from(coo.negJtr));
+      for (let row = 0; row < 4; row++) {
+        for (let col = 0; col < 4; col++) {
+          expect(cached.JtJ.get(row, col)).toBe(coo.JtJ.get(row, col));
+        }
+      }
+    }
+
+    // Variable 1 is never referenced, so its row is empty
+    expect(pattern.rowPointers[2] - pattern.rowPointers[1]).toBe(0);
+  });
+
+  it('overwrites reused output buffers on each call', () => {
+    const providers: AnalyticalResidualProvider[] = [
+      {
+        variableIndices: [0, 1],
+        computeResidual: (vars) => vars[0] - vars[1],
+        computeGradient: () => new Float64Array([1, -1]),
+      },
+      {
+        variableIndices: [1],
+        computeResidual: (vars) => vars[1] - 2,
+        computeGradient: () => new Float64Array([1]),
+      },
+    ];
+    const buffers = createNormalEquationsBuffers(providers.length, 2);
+
+    for (const variables of [new Float64Array([5, 1]), new Float64Array([3, 4])]) {
+      const fresh = accumulateNormalEquations(variables, providers, 2);
+      const reused = accumulateNormalEquations(variables, providers, 2, undefined, buffers);
+
+      expect(reused.negJtr).toBe(buffers.negJtr);
+      expect(reused.residuals).toBe(buffers.residuals);
+      expect(Array.from(reused.negJtr)).toEqual(Array.from(fresh.negJtr));
+      expect(Array.from(reused.residuals)).toEqual(Array.from(fresh.residuals));
+      expect(reused.cost).toBe(fresh.cost);
+    }
+  });
 });
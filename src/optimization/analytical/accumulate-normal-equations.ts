@@ -9,7 +9,7 @@
  * vs O(M × N²) for dense Jacobian approach.
  */
 
-import { SparseMatrix, Triplet } from '../sparse/SparseMatrix';
+import { SparseMatrix } from '../sparse/SparseMatrix';
 import { AnalyticalResidualProvider } from './types';
 
 /**
@@ -29,6 +29,137 @@ export interface NormalEquations {
   residuals: Float64Array;
 }
 
+/**
+ * Sparsity pattern of J^T J for a fixed list of providers.
+ *
+ * The pattern depends only on the providers' variableIndices, which do not
+ * change during a solve, so it can be built once and reused every LM iteration
+ * instead of re-sorting the COO entries each time.
+ */
+export interface NormalEquationsPattern {
+  /** CSR row pointers of J^T J */
+  rowPointers: number[];
+
+  /** CSR column indices of J^T J (sorted within each row) */
+  colIndices: number[];
+
+  /** CSR slot of each J^T J contribution, in accumulation order */
+  slots: Int32Array;
+}
+
+/**
+ * Output buffers for accumulateNormalEquations, reused across LM iterations
+ * so the per-iteration vectors are not reallocated on every call.
+ */
+export interface NormalEquationsBuffers {
+  /** Receives -J^T r (length numVariables) */
+  negJtr: Float64Array;
+
+  /** Receives the individual residuals (length providers.length) */
+  residuals: Float64Array;
+}
+
+/**
+ * Creates output buffers sized for the given problem.
+ */
+export function createNormalEquationsBuffers(
+  numResiduals: number,
+  numVariables: number
+): NormalEquationsBuffers {
+  return {
+    negJtr: new Float64Array(numVariables),
+    residuals: new Float64Array(numResiduals),
+  };
+}
+
+/**
+ * Builds the J^T J sparsity pattern for the given providers.
+ * Contributions are visited in the same order as accumulateNormalEquations.
+ */
+export function buildNormalEquationsPattern(
+  providers: readonly AnalyticalResidualProvider[],
+  numVariables: number
+): NormalEquationsPattern {
+  let capacity = 0;
+  for (let p = 0; p < providers.length; p++) {
+    const k = providers[p].variableIndices.length;
+    capacity += k * k;
+  }
+  const rowIdx = new Int32Array(capacity);
+  const colIdx = new Int32Array(capacity);
+  let count = 0;
+
+  for (let p = 0; p < providers.length; p++) {
+    const idx = providers[p].variableIndices;
+    for (let i = 0; i < idx.length; i++) {
+      const vi = idx[i];
+      if (vi < 0) continue;
+      for (let j = i; j < idx.length; j++) {
+        const vj = idx[j];
+        if (vj < 0) continue;
+        rowIdx[count] = vi;
+        colIdx[count++] = vj;
+        if (vi !== vj) {
+          rowIdx[count] = vj;
+          colIdx[count++] = vi;
+        }
+      }
+    }
+  }
+
+  // Bucket contributions by row (counting sort)
+  const rowStart = new Int32Array(numVariables + 1);
+  for (let k = 0; k < count; k++) {
+    rowStart[rowIdx[k] + 1]++;
+  }
+  for (let row = 0; row < numVariables; row++) {
+    rowStart[row + 1] += rowStart[row];
+  }
+  const order = new Int32Array(count);
+  const fill = rowStart.slice(0, numVariables);
+  for (let k = 0; k < count; k++) {
+    order[fill[rowIdx[k]]++] = k;
+  }
+
+  // Unique sorted columns per row, and the slot of every contribution
+  const slotOfCol = new Int32Array(numVariables).fill(-1);
+  const rowCols: number[] = [];
+  const rowPointers = new Array<number>(numVariables + 1);
+  const colIndices: number[] = [];
+  const slots = new Int32Array(count);
+
+  for (let row = 0; row < numVariables; row++) {
+    rowPointers[row] = colIndices.length;
+    rowCols.length = 0;
+
+    for (let o = rowStart[row]; o < rowStart[row + 1]; o++) {
+      const col = colIdx[order[o]];
+      if (slotOfCol[col] < 0) {
+        slotOfCol[col] = 0;
+        rowCols.push(col);
+      }
+    }
+
+    rowCols.sort((a, b) => a - b);
+    for (const col of rowCols) {
+      slotOfCol[col] = colIndices.length;
+      colIndices.push(col);
+    }
+
+    for (let o = rowStart[row]; o < rowStart[row + 1]; o++) {
+      const k = order[o];
+      slots[k] = slotOfCol[colIdx[k]];
+    }
+
+    for (const col of rowCols) {
+      slotOfCol[col] = -1;
+    }
+  }
+  rowPointers[numVariables] = colIndices.length;
+
+  return { rowPointers, colIndices, slots };
+}
+
 /**
  * Accumulates J^T J and J^T r directly from providers.
  * Never materializes the full Jacobian.
@@ -40,18 +171,40 @@ export interface NormalEquations {
  * @param variables Current variable values
  * @param providers Residual providers (one per residual)
  * @param numVariables Total number of variables (for matrix dimensions)
+ * @param pattern Optional precomputed J^T J pattern for these providers
+ *   (see buildNormalEquationsPattern); values are then summed directly into it
+ * @param buffers Optional output buffers (see createNormalEquationsBuffers);
+ *   the returned negJtr and residuals are then these arrays, overwritten in place
  * @returns Normal equations ready for solving
  */
 export function accumulateNormalEquations(
   variables: Float64Array,
   providers: readonly AnalyticalResidualProvider[],
-  numVariables: number
+  numVariables: number,
+  pattern?: NormalEquationsPattern,
+  buffers?: NormalEquationsBuffers
 ): NormalEquations {
   const m = providers.length;
 
-  const triplets: Triplet[] = [];
-  const negJtr = new Float64Array(numVariables);
-  const residuals = new Float64Array(m);
+  // Without a pattern, J^T J entries are collected as parallel COO arrays
+  // (struct-of-arrays) sized up front from the providers' sparsity.
+  let capacity = 0;
+  if (!pattern) {
+    for (let p = 0; p < m; p++) {
+      const k = providers[p].variableIndices.length;
+      capacity += k * k;
+    }
+  }
+  const rowIdx = new Int32Array(capacity);
+  const colIdx = new Int32Array(capacity);
+  const vals = new Float64Array(capacity);
+  let count = 0;
+
+  const slots = pattern ? pattern.slots : null;
+  const csrValues = pattern ? new Array<number>(pattern.colIndices.length).fill(0) : null;
+
+  const negJtr = buffers ? buffers.negJtr.fill(0) : new Float64Array(numVariables);
+  const residuals = buffers ? buffers.residuals : new Float64Array(m);
   let cost = 0;
 
   for (let p = 0; p < m; p++) {
@@ -73,9 +226,20 @@ export function accumulateNormalEquations(
         if (vj < 0) continue; // Locked variable
 
         const contrib = grad[i] * grad[j];
-        triplets.push({ row: vi, col: vj, value: contrib });
+        if (slots) {
+          csrValues![slots[count++]] += contrib;
+          if (vi !== vj) {
+            csrValues![slots[count++]] += contrib; // Symmetric
+          }
+          continue;
+        }
+        rowIdx[count] = vi;
+        colIdx[count] = vj;
+        vals[count++] = contrib;
         if (vi !== vj) {
-          triplets.push({ row: vj, col: vi, value: contrib }); // Symmetric
+          rowIdx[count] = vj; // Symmetric
+          colIdx[count] = vi;
+          vals[count++] = contrib;
         }
       }
 
@@ -84,7 +248,9 @@ export function accumulateNormalEquations(
     }
   }
 
-  const JtJ = SparseMatrix.fromTriplets(numVariables, numVariables, triplets);
+  const JtJ = pattern
+    ? SparseMatrix.fromCsr(numVariables, numVariables, pattern.rowPointers, pattern.colIndices, csrValues!)
+    : SparseMatrix.fromCoo(numVariables, numVariables, rowIdx, colIdx, vals, count);
 
   return { JtJ, negJtr, cost, residuals };
 }
@@ -6,6 +6,13 @@
  */
 
 export type { AnalyticalResidualProvider, VariableLayout } from './types';
-export { accumulateNormalEquations, type NormalEquations } from './accumulate-normal-equations';
+export {
+  accumulateNormalEquations,
+  buildNormalEquationsPattern,
+  createNormalEquationsBuffers,
+  type NormalEquations,
+  type NormalEquationsBuffers,
+  type NormalEquationsPattern,
+} from './accumulate-normal-equations';
 export * from './providers';
 export { wrapWithNumericalGradient, wrapAllWithNumericalGradients } from './numerical-gradient-wrapper';
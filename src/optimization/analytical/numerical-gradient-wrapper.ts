@@ -27,16 +27,16 @@ export function wrapWithNumericalGradient(
 
       for (let i = 0; i < provider.variableIndices.length; i++) {
         const varIdx = provider.variableIndices[i];
+        const original = variables[varIdx];
 
-        // Create perturbed variable arrays
-        const varsPlus = new Float64Array(variables);
-        const varsMinus = new Float64Array(variables);
-        varsPlus[varIdx] += h;
-        varsMinus[varIdx] -= h;
+        // Perturb in place and restore, instead of copying the whole variable array
+        variables[varIdx] = original + h;
+        const resPlus = provider.computeResidual(variables);
+        variables[varIdx] = original - h;
+        const resMinus = provider.computeResidual(variables);
+        variables[varIdx] = original;
 
         // Central difference
-        const resPlus = provider.computeResidual(varsPlus);
-        const resMinus = provider.computeResidual(varsMinus);
         grad[i] = (resPlus - resMinus) / (2 * h);
       }
 
@@ -222,6 +222,45 @@ describe('Coplanar Provider', () => {
     const variables = new Float64Array([0, 0, 0, 1, 0, 0, 0, 1, 0, 0.5, 0.5, 0.5]);
     verifyGradient(provider, variables);
   });
+
+  it('matches the general provider when the plane points are locked', () => {
+    const a = { x: 0, y: 0, z: 0 };
+    const b = { x: 1, y: 0, z: 0 };
+    const c = { x: 0, y: 1, z: 0.2 };
+    const fixedPlane = createCoplanarProvider(
+      [-1, -1, -1],
+      [-1, -1, -1],
+      [-1, -1, -1],
+      [0, 1, 2],
+      () => a,
+      () => b,
+      () => c,
+      (vars) => ({ x: vars[0], y: vars[1], z: vars[2] })
+    );
+    const general = createCoplanarProvider(
+      [0, 1, 2],
+      [3, 4, 5],
+      [6, 7, 8],
+      [9, 10, 11],
+      (vars) => ({ x: vars[0], y: vars[1], z: vars[2] }),
+      (vars) => ({ x: vars[3], y: vars[4], z: vars[5] }),
+      (vars) => ({ x: vars[6], y: vars[7], z: vars[8] }),
+      (vars) => ({ x: vars[9], y: vars[10], z: vars[11] })
+    );
+
+    expect(fixedPlane.variableIndices).toEqual([0, 1, 2]);
+
+    const testPoint = new Float64Array([0.5, 0.5, 0.5]);
+    const all = new Float64Array([0, 0, 0, 1, 0, 0, 0, 1, 0.2, 0.5, 0.5, 0.5]);
+    expect(fixedPlane.computeResidual(testPoint)).toBeCloseTo(general.computeResidual(all), 10);
+
+    const generalGrad = general.computeGradient(all);
+    const fixedGrad = fixedPlane.computeGradient(testPoint);
+    for (let i = 0; i < 3; i++) {
+      expect(fixedGrad[i]).toBeCloseTo(generalGrad[9 + i], 10);
+    }
+    verifyGradient(fixedPlane, testPoint);
+  });
 });
 
 describe('Coplanar Providers (rotating base triangles)', () => {
@@ -509,6 +548,48 @@ describe('Reprojection Providers', () => {
     verifyGradient(provider, variables);
   });
 
+  it('gradient matches numerical with optimized intrinsics', () => {
+    // 10 = focal length, 11 = cx, 12 = cy
+    const intrinsicsWithAspect = {
+      fx: 1000,
+      fy: 1100,
+      cx: 320,
+      cy: 240,
+      k1: 0.1,
+      k2: 0.01,
+      k3: 0,
+      p1: 0.001,
+      p2: 0.001,
+    };
+
+    const [uProvider, vProvider] = createReprojectionProviders(
+      [0, 1, 2],
+      [3, 4, 5],
+      [6, 7, 8, 9],
+      intrinsicsWithAspect,
+      { observedU: 400, observedV: 200 },
+      getWorldPoint,
+      getCameraPos,
+      getQuat,
+      { focalLength: 10, cx: 11, cy: 12 }
+    );
+
+    expect(uProvider.variableIndices).toContain(11);
+    expect(uProvider.variableIndices).not.toContain(12);
+    expect(vProvider.variableIndices).toContain(12);
+    expect(vProvider.variableIndices).not.toContain(11);
+
+    const variables = new Float64Array([
+      1, 0.5, 5,
+      0, 0, 0,
+      1, 0, 0, 0,
+      950, 330, 250,
+    ]);
+
+    verifyGradient(uProvider, variables);
+    verifyGradient(vProvider, variables);
+  });
+
   it('handles locked world point coordinates', () => {
     // Lock X coordinate of world point (index = -1)
     // Variable layout when X is locked:
@@ -7,7 +7,7 @@
  */
 
 import { AnalyticalResidualProvider } from '../types';
-import { angle_residual_grad } from '../../residuals/gradients/angle-gradient';
+import { angle_residual, angle_residual_grad } from '../../residuals/gradients/angle-gradient';
 
 type Point3D = { x: number; y: number; z: number };
 
@@ -60,13 +60,12 @@ export function createAngleProvider(
     variableIndices: activeIndices,
 
     computeResidual(variables: Float64Array): number {
-      const { value } = angle_residual_grad(
+      return angle_residual(
         getPointA(variables),
         getVertex(variables),
         getPointC(variables),
         targetRadians
       );
-      return value;
     },
 
     computeGradient(variables: Float64Array): Float64Array {
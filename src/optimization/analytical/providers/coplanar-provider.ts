@@ -16,10 +16,66 @@
  */
 
 import { AnalyticalResidualProvider } from '../types';
-import { point_to_plane_distance_grad } from '../../residuals/gradients/point-to-plane-distance-gradient';
+import { point_to_plane_distance, point_to_plane_distance_grad } from '../../residuals/gradients/point-to-plane-distance-gradient';
 
 type Point3D = { x: number; y: number; z: number };
 
+/**
+ * Coplanar provider for a plane whose three points are all locked.
+ * The plane normal is constant, so it is computed on first use and the residual
+ * reduces to a dot product with the test point. Matches point_to_plane_distance.
+ */
+function createFixedPlaneProvider(
+  activeIndices: number[],
+  p3Map: readonly [number, number, number],
+  getP0: (variables: Float64Array) => Point3D,
+  getP1: (variables: Float64Array) => Point3D,
+  getP2: (variables: Float64Array) => Point3D,
+  getP3: (variables: Float64Array) => Point3D
+): AnalyticalResidualProvider {
+  let plane: { a: Point3D; nx: number; ny: number; nz: number } | null = null;
+
+  function getPlane(variables: Float64Array) {
+    if (!plane) {
+      const a = getP0(variables);
+      const b = getP1(variables);
+      const c = getP2(variables);
+      const e1x = b.x - a.x;
+      const e1y = b.y - a.y;
+      const e1z = b.z - a.z;
+      const e2x = c.x - a.x;
+      const e2y = c.y - a.y;
+      const e2z = c.z - a.z;
+      const nx = e1y * e2z - e1z * e2y;
+      const ny = e1z * e2x - e1x * e2z;
+      const nz = e1x * e2y - e1y * e2x;
+      const normalLen = Math.sqrt(nx * nx + ny * ny + nz * nz + 1e-7);
+      // Store the normal pre-divided by its length
+      plane = { a, nx: nx / normalLen, ny: ny / normalLen, nz: nz / normalLen };
+    }
+    return plane;
+  }
+
+  return {
+    variableIndices: activeIndices,
+
+    computeResidual(variables: Float64Array): number {
+      const { a, nx, ny, nz } = getPlane(variables);
+      const p = getP3(variables);
+      return (p.x - a.x) * nx + (p.y - a.y) * ny + (p.z - a.z) * nz;
+    },
+
+    computeGradient(variables: Float64Array): Float64Array {
+      const { nx, ny, nz } = getPlane(variables);
+      const grad = new Float64Array(activeIndices.length);
+      if (p3Map[0] >= 0) grad[p3Map[0]] = nx;
+      if (p3Map[1] >= 0) grad[p3Map[1]] = ny;
+      if (p3Map[2] >= 0) grad[p3Map[2]] = nz;
+      return grad;
+    },
+  };
+}
+
 /**
  * Creates a single coplanar residual provider using point-to-plane distance.
  *
@@ -58,18 +114,22 @@ export function createCoplanarProvider(
     }
   }
 
+  const planeFixed = p0Map.every(m => m < 0) && p1Map.every(m => m < 0) && p2Map.every(m => m < 0);
+  if (planeFixed) {
+    return createFixedPlaneProvider(activeIndices, p3Map, getP0, getP1, getP2, getP3);
+  }
+
   return {
     variableIndices: activeIndices,
 
     computeResidual(variables: Float64Array): number {
-      // point_to_plane_distance_grad(a, b, c, p) where a,b,c define plane, p is test point
-      const { value } = point_to_plane_distance_grad(
+      // point_to_plane_distance(a, b, c, p) where a,b,c define plane, p is test point
+      return point_to_plane_distance(
         getP0(variables),  // a - first plane point
         getP1(variables),  // b - second plane point
         getP2(variables),  // c - third plane point
         getP3(variables)   // p - test point
       );
-      return value;
     },
 
     computeGradient(variables: Float64Array): Float64Array {
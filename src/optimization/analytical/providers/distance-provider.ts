@@ -6,7 +6,7 @@
  */
 
 import { AnalyticalResidualProvider } from '../types';
-import { distance_residual_grad } from '../../residuals/gradients/distance-gradient';
+import { distance_residual, distance_residual_grad } from '../../residuals/gradients/distance-gradient';
 
 /**
  * Creates a provider for distance constraint between two points.
@@ -49,8 +49,7 @@ export function createDistanceProvider(
     computeResidual(variables: Float64Array): number {
       const p1 = getP1(variables);
       const p2 = getP2(variables);
-      const { value } = distance_residual_grad(p1, p2, targetDistance);
-      return value;
+      return distance_residual(p1, p2, targetDistance);
     },
 
     computeGradient(variables: Float64Array): Float64Array {
@@ -9,6 +9,24 @@ import { AnalyticalResidualProvider } from '../types';
 
 type Point3D = { x: number; y: number; z: number };
 
+/**
+ * Compute angle at vertex (in radians) without its gradient (residual path).
+ */
+function computeAngle(pointA: Point3D, vertex: Point3D, pointC: Point3D): number {
+  const v1x = pointA.x - vertex.x;
+  const v1y = pointA.y - vertex.y;
+  const v1z = pointA.z - vertex.z;
+  const v2x = pointC.x - vertex.x;
+  const v2y = pointC.y - vertex.y;
+  const v2z = pointC.z - vertex.z;
+
+  const dot = v1x * v2x + v1y * v2y + v1z * v2z;
+  const cx = v1y * v2z - v1z * v2y;
+  const cy = v1z * v2x - v1x * v2z;
+  const cz = v1x * v2y - v1y * v2x;
+  return Math.atan2(Math.sqrt(cx * cx + cy * cy + cz * cz), dot);
+}
+
 /**
  * Compute angle at vertex (in radians) and its gradient with respect to all three points.
  * Uses atan2(cross magnitude, dot product) for numerical stability.
@@ -179,10 +197,7 @@ export function createEqualAnglesProviders(
         const v2 = triplet2.getVertex(variables);
         const pC2 = triplet2.getPointC(variables);
 
-        const { angle: angle1 } = computeAngleAndGradient(pA1, v1, pC1);
-        const { angle: angle2 } = computeAngleAndGradient(pA2, v2, pC2);
-
-        return angle1 - angle2;
+        return computeAngle(pA1, v1, pC1) - computeAngle(pA2, v2, pC2);
       },
 
       computeGradient(variables: Float64Array): Float64Array {
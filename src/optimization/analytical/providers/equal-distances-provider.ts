@@ -9,6 +9,16 @@ import { AnalyticalResidualProvider } from '../types';
 
 type Point3D = { x: number; y: number; z: number };
 
+/**
+ * Compute distance between two points (residual path, no gradient).
+ */
+function computeDistance(p1: Point3D, p2: Point3D): number {
+  const dx = p2.x - p1.x;
+  const dy = p2.y - p1.y;
+  const dz = p2.z - p1.z;
+  return Math.sqrt(dx * dx + dy * dy + dz * dz);
+}
+
 /**
  * Compute distance and its gradient with respect to both points.
  * Returns raw distance (not normalized by target).
@@ -103,10 +113,7 @@ export function createEqualDistancesProviders(
         const p1_2 = pair2.getP1(variables);
         const p2_2 = pair2.getP2(variables);
 
-        const { dist: dist1 } = computeDistanceAndGradient(p1_1, p2_1);
-        const { dist: dist2 } = computeDistanceAndGradient(p1_2, p2_2);
-
-        return dist1 - dist2;
+        return computeDistance(p1_1, p2_1) - computeDistance(p1_2, p2_2);
       },
 
       computeGradient(variables: Float64Array): Float64Array {
@@ -8,9 +8,9 @@
  */
 
 import { AnalyticalResidualProvider } from '../types';
-import { fixed_point_x_grad } from '../../residuals/gradients/fixed-point-x-gradient';
-import { fixed_point_y_grad } from '../../residuals/gradients/fixed-point-y-gradient';
-import { fixed_point_z_grad } from '../../residuals/gradients/fixed-point-z-gradient';
+import { fixed_point_x } from '../../residuals/gradients/fixed-point-x-gradient';
+import { fixed_point_y } from '../../residuals/gradients/fixed-point-y-gradient';
+import { fixed_point_z } from '../../residuals/gradients/fixed-point-z-gradient';
 
 /**
  * Creates a provider for a fixed point X constraint.
@@ -29,20 +29,21 @@ export function createFixedPointXProvider(
   if (pointXIndex < 0) return null;
 
   const variableIndices = [pointXIndex];
+  // Constant gradient, allocated once and returned on every call
+  const gradient = new Float64Array([1]);
 
   return {
     variableIndices,
 
     computeResidual(variables: Float64Array): number {
       const x = getPointX(variables);
-      const { value } = fixed_point_x_grad({ x, y: 0, z: 0 }, targetX);
-      return value;
+      return fixed_point_x({ x, y: 0, z: 0 }, targetX);
     },
 
-    computeGradient(_variables: Float64Array): Float64Array {
+    computeGradient(_variables: Float64Array): Readonly<Float64Array> {
       // d/dx (x - target) = 1
       // The gradient function returns dp.x = 1, which we already know
-      return new Float64Array([1]);
+      return gradient;
     },
   };
 }
@@ -59,18 +60,19 @@ export function createFixedPointYProvider(
   if (pointYIndex < 0) return null;
 
   const variableIndices = [pointYIndex];
+  // Constant gradient, allocated once and returned on every call
+  const gradient = new Float64Array([1]);
 
   return {
     variableIndices,
 
     computeResidual(variables: Float64Array): number {
       const y = getPointY(variables);
-      const { value } = fixed_point_y_grad({ x: 0, y, z: 0 }, targetY);
-      return value;
+      return fixed_point_y({ x: 0, y, z: 0 }, targetY);
     },
 
-    computeGradient(_variables: Float64Array): Float64Array {
-      return new Float64Array([1]);
+    computeGradient(_variables: Float64Array): Readonly<Float64Array> {
+      return gradient;
     },
   };
 }
@@ -87,22 +89,31 @@ export function createFixedPointZProvider(
   if (pointZIndex < 0) return null;
 
   const variableIndices = [pointZIndex];
+  // Constant gradient, allocated once and returned on every call
+  const gradient = new Float64Array([1]);
 
   return {
     variableIndices,
 
     computeResidual(variables: Float64Array): number {
       const z = getPointZ(variables);
-      const { value } = fixed_point_z_grad({ x: 0, y: 0, z }, targetZ);
-      return value;
+      return fixed_point_z({ x: 0, y: 0, z }, targetZ);
     },
 
-    computeGradient(_variables: Float64Array): Float64Array {
-      return new Float64Array([1]);
+    computeGradient(_variables: Float64Array): Readonly<Float64Array> {
+      return gradient;
     },
   };
 }
 
+const AXIS_KEYS = ['x', 'y', 'z'] as const;
+
+const AXIS_PROVIDER_FACTORIES = [
+  createFixedPointXProvider,
+  createFixedPointYProvider,
+  createFixedPointZProvider,
+] as const;
+
 /**
  * Creates providers for all free coordinates of a fixed point constraint.
  * Returns 0-3 providers depending on which coordinates are free.
@@ -118,26 +129,15 @@ export function createFixedPointProviders(
 ): AnalyticalResidualProvider[] {
   const providers: AnalyticalResidualProvider[] = [];
 
-  const xProvider = createFixedPointXProvider(
-    pointIndices[0],
-    target[0],
-    (vars) => getPoint(vars).x
-  );
-  if (xProvider) providers.push(xProvider);
-
-  const yProvider = createFixedPointYProvider(
-    pointIndices[1],
-    target[1],
-    (vars) => getPoint(vars).y
-  );
-  if (yProvider) providers.push(yProvider);
-
-  const zProvider = createFixedPointZProvider(
-    pointIndices[2],
-    target[2],
-    (vars) => getPoint(vars).z
-  );
-  if (zProvider) providers.push(zProvider);
+  for (let axis = 0; axis < 3; axis++) {
+    const key = AXIS_KEYS[axis];
+    const provider = AXIS_PROVIDER_FACTORIES[axis](
+      pointIndices[axis],
+      target[axis],
+      (vars) => getPoint(vars)[key]
+    );
+    if (provider) providers.push(provider);
+  }
 
   return providers;
 }
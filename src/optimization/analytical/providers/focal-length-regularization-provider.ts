@@ -42,13 +42,16 @@ export function createFocalLengthBelowMinProvider(
     };
   }
 
+  // Constant factor hoisted out of the per-iteration residual/gradient
+  const scale = weight / maxDim;
+
   return {
     variableIndices: [focalLengthIdx],
 
     computeResidual(variables: Float64Array): number {
       const f = variables[focalLengthIdx];
       const belowMin = Math.max(0, minF - f);
-      return weight * belowMin / maxDim;
+      return belowMin * scale;
     },
 
     computeGradient(variables: Float64Array): Float64Array {
@@ -56,7 +59,7 @@ export function createFocalLengthBelowMinProvider(
       // d/df of weight * max(0, (minF - f)) / maxDim
       // = -weight / maxDim when f < minF
       // = 0 otherwise
-      const grad = f < minF ? -weight / maxDim : 0;
+      const grad = f < minF ? -scale : 0;
       return new Float64Array([grad]);
     },
   };
@@ -88,13 +91,15 @@ export function createFocalLengthAboveMaxProvider(
     };
   }
 
+  const scale = weight / maxDim;
+
   return {
     variableIndices: [focalLengthIdx],
 
     computeResidual(variables: Float64Array): number {
       const f = variables[focalLengthIdx];
       const aboveMax = Math.max(0, f - maxF);
-      return weight * aboveMax / maxDim;
+      return aboveMax * scale;
     },
 
     computeGradient(variables: Float64Array): Float64Array {
@@ -102,7 +107,7 @@ export function createFocalLengthAboveMaxProvider(
       // d/df of weight * max(0, (f - maxF)) / maxDim
       // = weight / maxDim when f > maxF
       // = 0 otherwise
-      const grad = f > maxF ? weight / maxDim : 0;
+      const grad = f > maxF ? scale : 0;
       return new Float64Array([grad]);
     },
   };
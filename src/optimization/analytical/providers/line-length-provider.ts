@@ -6,7 +6,7 @@
  */
 
 import { AnalyticalResidualProvider } from '../types';
-import { line_length_grad } from '../../residuals/gradients/line-length-gradient';
+import { line_length, line_length_grad } from '../../residuals/gradients/line-length-gradient';
 
 /**
  * Creates a provider for line length constraint.
@@ -50,8 +50,7 @@ export function createLineLengthProvider(
     computeResidual(variables: Float64Array): number {
       const pA = getPA(variables);
       const pB = getPB(variables);
-      const { value } = line_length_grad(pA, pB, targetLength, scale);
-      return value;
+      return line_length(pA, pB, targetLength, scale);
     },
 
     computeGradient(variables: Float64Array): Float64Array {
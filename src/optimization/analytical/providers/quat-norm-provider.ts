@@ -7,7 +7,7 @@
  */
 
 import { AnalyticalResidualProvider } from '../types';
-import { quat_norm_residual_grad } from '../../residuals/gradients/quat-norm-gradient';
+import { quat_norm_residual, quat_norm_residual_grad } from '../../residuals/gradients/quat-norm-gradient';
 
 /**
  * Creates a provider for quaternion normalization constraint.
@@ -38,8 +38,7 @@ export function createQuatNormProvider(
 
     computeResidual(variables: Float64Array): number {
       const q = getQuat(variables);
-      const { value } = quat_norm_residual_grad(q);
-      return value;
+      return quat_norm_residual(q);
     },
 
     computeGradient(variables: Float64Array): Float64Array {
@@ -12,6 +12,8 @@ import { AnalyticalResidualProvider } from '../types';
 /** Point getter type - returns {x, y, z} from variables array */
 type PointGetter = (variables: Float64Array) => { x: number; y: number; z: number };
 
+const AXIS_KEYS = ['x', 'y', 'z'] as const;
+
 /**
  * Creates a regularization provider for a single axis of a world point.
  *
@@ -39,18 +41,20 @@ export function createRegularizationProvider(
     };
   }
 
+  const axisKey = AXIS_KEYS[axis];
+  // Constant gradient, allocated once and returned on every call
+  const gradient = new Float64Array([weight]);
+
   return {
     variableIndices: [varIdx],
 
     computeResidual(variables: Float64Array): number {
-      const point = getPoint(variables);
-      const values = [point.x, point.y, point.z];
-      return weight * (values[axis] - initialValue);
+      return weight * (getPoint(variables)[axisKey] - initialValue);
     },
 
-    computeGradient(variables: Float64Array): Float64Array {
+    computeGradient(variables: Float64Array): Readonly<Float64Array> {
       // d/d(point[axis]) of weight * (point[axis] - initial) = weight
-      return new Float64Array([weight]);
+      return gradient;
     },
   };
 }
@@ -11,7 +11,7 @@
  *
  * Supports both fixed and optimized intrinsics:
  * - Fixed intrinsics (index = -1): uses locked values
- * - Variable intrinsics (index >= 0): reads from variable array, computes numerical gradients
+ * - Variable intrinsics (index >= 0): reads from variable array, computes closed-form gradients
  *
  * Variables affected:
  * - world point (3), camera position (3), quaternion (4) = 10 base variables
@@ -77,8 +77,10 @@ export interface ReprojectionFlags {
  * dcam/dt = 2*q_vec*q_vec^T + (w² - |q_vec|²)*I + 2*w*[q_vec×]
  *
  * where [q_vec×] is the skew-symmetric cross-product matrix.
+ *
+ * Written row-major into out (length 9), which is returned.
  */
-function quatRotateDerivative_dt(q: Quaternion): number[][] {
+function quatRotateDerivative_dt(q: Quaternion, out: Float64Array): Float64Array {
   const { w, x: qx, y: qy, z: qz } = q;
 
   // w² - |q_vec|²
@@ -101,11 +103,17 @@ function quatRotateDerivative_dt(q: Quaternion): number[][] {
   // [2*w*qz    0         -2*w*qx ]
   // [-2*w*qy   2*w*qx    0       ]
 
-  return [
-    [2 * qx * qx + wSqMinusQVecSq,     2 * qx * qy - 2 * w * qz,      2 * qx * qz + 2 * w * qy],
-    [2 * qy * qx + 2 * w * qz,         2 * qy * qy + wSqMinusQVecSq,  2 * qy * qz - 2 * w * qx],
-    [2 * qz * qx - 2 * w * qy,         2 * qz * qy + 2 * w * qx,      2 * qz * qz + wSqMinusQVecSq],
-  ];
+  const R = out;
+  R[0] = 2 * qx * qx + wSqMinusQVecSq;
+  R[1] = 2 * qx * qy - 2 * w * qz;
+  R[2] = 2 * qx * qz + 2 * w * qy;
+  R[3] = 2 * qy * qx + 2 * w * qz;
+  R[4] = 2 * qy * qy + wSqMinusQVecSq;
+  R[5] = 2 * qy * qz - 2 * w * qx;
+  R[6] = 2 * qz * qx - 2 * w * qy;
+  R[7] = 2 * qz * qy + 2 * w * qx;
+  R[8] = 2 * qz * qz + wSqMinusQVecSq;
+  return R;
 }
 
 /**
@@ -182,9 +190,6 @@ type DcamGradFn = (
   observed: number
 ) => { value: number; dcamX: number; dcamY: number; dcamZ: number };
 
-// Numerical differentiation epsilon
-const NUM_GRAD_EPS = 1e-7;
-
 // Behind-camera penalty constants (must match autodiff in ImagePoint.ts)
 const NEAR_PLANE = 0.1;
 const PENALTY_SCALE = 500;
@@ -194,7 +199,7 @@ const PENALTY_SCALE = 500;
  *
  * When intrinsicsIndices are provided and valid (>= 0), the provider:
  * - Reads intrinsics values from the variable array
- * - Computes numerical gradients for intrinsics parameters
+ * - Computes closed-form gradients for intrinsics parameters
  *
  * @param isUComponent - true for U residual, false for V
  */
@@ -243,7 +248,7 @@ function createReprojectionComponentProvider(
     }
   }
 
-  // Intrinsics indices (for numerical gradients)
+  // Intrinsics indices
   // Only add if we're optimizing them
   let focalLengthMap = -1;
   let cxMap = -1;
@@ -265,29 +270,30 @@ function createReprojectionComponentProvider(
     }
   }
 
+  // Fixed for the lifetime of the provider: focal length scales fx and fy together
+  const aspectRatio = intrinsics.fy / intrinsics.fx;
+  const optimizesIntrinsics = focalLengthMap >= 0 || cxMap >= 0 || cyMap >= 0;
+  const focalLengthIdx = intrinsicsIndices ? intrinsicsIndices.focalLength : -1;
+  const cxIdx = intrinsicsIndices ? intrinsicsIndices.cx : -1;
+  const cyIdx = intrinsicsIndices ? intrinsicsIndices.cy : -1;
+  // dcam/dt scratch (row-major 3x3), filled on each gradient evaluation
+  const dcamDt = new Float64Array(9);
+
   /**
    * Get intrinsics values, reading from variables array when optimizing
    */
   function getIntrinsicsValues(variables: Float64Array): CameraIntrinsics {
-    let fx = intrinsics.fx;
-    let fy = intrinsics.fy;
-    const cx = (intrinsicsIndices && intrinsicsIndices.cx >= 0)
-      ? variables[intrinsicsIndices.cx]
-      : intrinsics.cx;
-    const cy = (intrinsicsIndices && intrinsicsIndices.cy >= 0)
-      ? variables[intrinsicsIndices.cy]
-      : intrinsics.cy;
-
-    // When optimizing focal length, read it and recompute fx, fy
-    if (intrinsicsIndices && intrinsicsIndices.focalLength >= 0) {
-      const focalLength = variables[intrinsicsIndices.focalLength];
-      // fx = focalLength, fy = focalLength * aspectRatio
-      // aspectRatio = fy / fx originally
-      const aspectRatio = intrinsics.fy / intrinsics.fx;
-      fx = focalLength;
-      fy = focalLength * aspectRatio;
+    // Nothing this component depends on is optimized: the fixed values apply
+    if (!optimizesIntrinsics) {
+      return intrinsics;
     }
 
+    // fx = focalLength, fy = focalLength * aspectRatio when optimizing focal length
+    const fx = focalLengthIdx >= 0 ? variables[focalLengthIdx] : intrinsics.fx;
+    const fy = focalLengthIdx >= 0 ? fx * aspectRatio : intrinsics.fy;
+    const cx = cxIdx >= 0 ? variables[cxIdx] : intrinsics.cx;
+    const cy = cyIdx >= 0 ? variables[cyIdx] : intrinsics.cy;
+
     return {
       fx,
       fy,
@@ -352,7 +358,7 @@ function createReprojectionComponentProvider(
     const grad = new Float64Array(activeIndices.length);
 
     // Derivative of quatRotate with respect to t
-    const R = quatRotateDerivative_dt(q);
+    const R = quatRotateDerivative_dt(q, dcamDt);
 
     // dcam/dq
     const quatGrad = quatRotateGradient(q, t);
@@ -362,14 +368,14 @@ function createReprojectionComponentProvider(
     const dPenalty_dcamZ = -PENALTY_SCALE;
 
     // World point gradient: dcamZ/dwp = R[2][0..2]
-    if (wpMap[0] >= 0) grad[wpMap[0]] = dPenalty_dcamZ * R[2][0];
-    if (wpMap[1] >= 0) grad[wpMap[1]] = dPenalty_dcamZ * R[2][1];
-    if (wpMap[2] >= 0) grad[wpMap[2]] = dPenalty_dcamZ * R[2][2];
+    if (wpMap[0] >= 0) grad[wpMap[0]] = dPenalty_dcamZ * R[6];
+    if (wpMap[1] >= 0) grad[wpMap[1]] = dPenalty_dcamZ * R[7];
+    if (wpMap[2] >= 0) grad[wpMap[2]] = dPenalty_dcamZ * R[8];
 
     // Camera position gradient: dcamZ/dcp = -R[2][0..2]
-    if (cpMap[0] >= 0) grad[cpMap[0]] = dPenalty_dcamZ * (-R[2][0]);
-    if (cpMap[1] >= 0) grad[cpMap[1]] = dPenalty_dcamZ * (-R[2][1]);
-    if (cpMap[2] >= 0) grad[cpMap[2]] = dPenalty_dcamZ * (-R[2][2]);
+    if (cpMap[0] >= 0) grad[cpMap[0]] = dPenalty_dcamZ * (-R[6]);
+    if (cpMap[1] >= 0) grad[cpMap[1]] = dPenalty_dcamZ * (-R[7]);
+    if (cpMap[2] >= 0) grad[cpMap[2]] = dPenalty_dcamZ * (-R[8]);
 
     // Quaternion gradient: dcamZ/dq
     if (qMap[0] >= 0) grad[qMap[0]] = dPenalty_dcamZ * quatGrad.dw.z;
@@ -448,7 +454,7 @@ function createReprojectionComponentProvider(
       const cParam = isUComponent ? currentIntrinsics.cx : currentIntrinsics.cy;
 
       // Get dcam gradient - evaluated at the (possibly negated) camera point
-      const { dcamX, dcamY, dcamZ } = dcamGradFn(
+      const { value, dcamX, dcamY, dcamZ } = dcamGradFn(
         cam.x,
         cam.y,
         cam.z,
@@ -463,7 +469,7 @@ function createReprojectionComponentProvider(
       );
 
       // Derivative of quatRotate with respect to t
-      const R = quatRotateDerivative_dt(q);
+      const R = quatRotateDerivative_dt(q, dcamDt);
 
       // dcam/dq (computed from the original transformation, without negation)
       const quatGrad = quatRotateGradient(q, t);
@@ -479,9 +485,9 @@ function createReprojectionComponentProvider(
       // dcam/dwp = signFlip * R
       // dResidual/dwp = [dcamX, dcamY, dcamZ] * (signFlip * R)
       if (wpMap[0] >= 0 || wpMap[1] >= 0 || wpMap[2] >= 0) {
-        const dwpX = signFlip * (dcamX * R[0][0] + dcamY * R[1][0] + dcamZ * R[2][0]);
-        const dwpY = signFlip * (dcamX * R[0][1] + dcamY * R[1][1] + dcamZ * R[2][1]);
-        const dwpZ = signFlip * (dcamX * R[0][2] + dcamY * R[1][2] + dcamZ * R[2][2]);
+        const dwpX = signFlip * (dcamX * R[0] + dcamY * R[3] + dcamZ * R[6]);
+        const dwpY = signFlip * (dcamX * R[1] + dcamY * R[4] + dcamZ * R[7]);
+        const dwpZ = signFlip * (dcamX * R[2] + dcamY * R[5] + dcamZ * R[8]);
 
         if (wpMap[0] >= 0) grad[wpMap[0]] = dwpX;
         if (wpMap[1] >= 0) grad[wpMap[1]] = dwpY;
@@ -491,9 +497,9 @@ function createReprojectionComponentProvider(
       // Camera position gradient: dcam/dcp = -signFlip * R
       // dResidual/dcp = [dcamX, dcamY, dcamZ] * (-signFlip * R)
       if (cpMap[0] >= 0 || cpMap[1] >= 0 || cpMap[2] >= 0) {
-        const dcpX = -signFlip * (dcamX * R[0][0] + dcamY * R[1][0] + dcamZ * R[2][0]);
-        const dcpY = -signFlip * (dcamX * R[0][1] + dcamY * R[1][1] + dcamZ * R[2][1]);
-        const dcpZ = -signFlip * (dcamX * R[0][2] + dcamY * R[1][2] + dcamZ * R[2][2]);
+        const dcpX = -signFlip * (dcamX * R[0] + dcamY * R[3] + dcamZ * R[6]);
+        const dcpY = -signFlip * (dcamX * R[1] + dcamY * R[4] + dcamZ * R[7]);
+        const dcpZ = -signFlip * (dcamX * R[2] + dcamY * R[5] + dcamZ * R[8]);
 
         if (cpMap[0] >= 0) grad[cpMap[0]] = dcpX;
         if (cpMap[1] >= 0) grad[cpMap[1]] = dcpY;
@@ -515,34 +521,19 @@ function createReprojectionComponentProvider(
         grad[qMap[3]] = signFlip * (dcamX * quatGrad.dz.x + dcamY * quatGrad.dz.y + dcamZ * quatGrad.dz.z);
       }
 
-      // Intrinsics gradients (numerical differentiation)
-      // Only compute for parameters we're actually optimizing
-      const baseResidual = computeResidualWithIntrinsics(variables, currentIntrinsics);
-
-      if (focalLengthMap >= 0 && intrinsicsIndices!.focalLength >= 0) {
-        // Perturb focalLength
-        const perturbedIntrinsics = { ...currentIntrinsics };
-        const aspectRatio = currentIntrinsics.fy / currentIntrinsics.fx;
-        perturbedIntrinsics.fx = currentIntrinsics.fx + NUM_GRAD_EPS;
-        perturbedIntrinsics.fy = perturbedIntrinsics.fx * aspectRatio;
-        const perturbedResidual = computeResidualWithIntrinsics(variables, perturbedIntrinsics);
-        grad[focalLengthMap] = (perturbedResidual - baseResidual) / NUM_GRAD_EPS;
+      // Intrinsics gradients (closed form)
+      // U: residual = fx * distortedX + cx - observedU
+      // V: residual = cy - fy * distortedY - observedV, with fy = focalLength * aspectRatio
+      // Both give d(residual)/d(focalLength) = (residual + observed - c) / fx,
+      // and d(residual)/d(c) = 1 for the principal point coordinate of this component.
+      if (focalLengthMap >= 0) {
+        grad[focalLengthMap] = (value + observed - cParam) / currentIntrinsics.fx;
       }
-
-      if (cxMap >= 0 && intrinsicsIndices!.cx >= 0) {
-        // Perturb cx
-        const perturbedIntrinsics = { ...currentIntrinsics };
-        perturbedIntrinsics.cx = currentIntrinsics.cx + NUM_GRAD_EPS;
-        const perturbedResidual = computeResidualWithIntrinsics(variables, perturbedIntrinsics);
-        grad[cxMap] = (perturbedResidual - baseResidual) / NUM_GRAD_EPS;
+      if (cxMap >= 0) {
+        grad[cxMap] = 1;
       }
-
-      if (cyMap >= 0 && intrinsicsIndices!.cy >= 0) {
-        // Perturb cy
-        const perturbedIntrinsics = { ...currentIntrinsics };
-        perturbedIntrinsics.cy = currentIntrinsics.cy + NUM_GRAD_EPS;
-        const perturbedResidual = computeResidualWithIntrinsics(variables, perturbedIntrinsics);
-        grad[cyMap] = (perturbedResidual - baseResidual) / NUM_GRAD_EPS;
+      if (cyMap >= 0) {
+        grad[cyMap] = 1;
       }
 
       return grad;
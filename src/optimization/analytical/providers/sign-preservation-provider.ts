@@ -13,6 +13,8 @@ import { AnalyticalResidualProvider } from '../types';
 /** Point getter type - returns {x, y, z} from variables array */
 type PointGetter = (variables: Float64Array) => { x: number; y: number; z: number };
 
+const AXIS_KEYS = ['x', 'y', 'z'] as const;
+
 /**
  * Creates a sign preservation provider for a single axis of a world point.
  *
@@ -52,14 +54,13 @@ export function createSignPreservationProvider(
   }
 
   const initialSign = initialValue > 0 ? 1 : -1;
+  const axisKey = AXIS_KEYS[axis];
 
   return {
     variableIndices: [varIdx],
 
     computeResidual(variables: Float64Array): number {
-      const point = getPoint(variables);
-      const values = [point.x, point.y, point.z];
-      const current = values[axis];
+      const current = getPoint(variables)[axisKey];
       const currentSign = current > 0 ? 1 : -1;
 
       // If signs match, no penalty
@@ -72,9 +73,7 @@ export function createSignPreservationProvider(
     },
 
     computeGradient(variables: Float64Array): Float64Array {
-      const point = getPoint(variables);
-      const values = [point.x, point.y, point.z];
-      const current = values[axis];
+      const current = getPoint(variables)[axisKey];
       const currentSign = current > 0 ? 1 : -1;
 
       // If signs match, gradient is 0
@@ -6,7 +6,7 @@
  */
 
 import { AnalyticalResidualProvider } from '../types';
-import { vanishing_line_residual_grad } from '../../residuals/gradients/vanishing-line-gradient';
+import { vanishing_line_residual, vanishing_line_residual_grad } from '../../residuals/gradients/vanishing-line-gradient';
 
 type Point3D = { x: number; y: number; z: number };
 type Quaternion = { w: number; x: number; y: number; z: number };
@@ -45,8 +45,7 @@ export function createVanishingLineProvider(
 
     computeResidual(variables: Float64Array): number {
       const q = getQuat(variables);
-      const { value } = vanishing_line_residual_grad(q, axis, obsU, obsV, weight);
-      return value;
+      return vanishing_line_residual(q, axis, obsU, obsV, weight);
     },
 
     computeGradient(variables: Float64Array): Float64Array {
@@ -53,8 +53,12 @@ export interface AnalyticalResidualProvider {
    * Returns array of same length as variableIndices.
    *
    * gradient[i] = d(residual) / d(variables[variableIndices[i]])
+   *
+   * The returned array is owned by the provider and may be the same
+   * instance on every call (e.g. a constant gradient). Callers must read
+   * it before the next call and must not modify it.
    */
-  computeGradient(variables: Float64Array): Float64Array;
+  computeGradient(variables: Float64Array): Readonly<Float64Array>;
 
   /**
    * Optional owner info for mapping residuals back to entities after solve.
@@ -110,6 +114,12 @@ export interface VariableLayout {
    */
   getLockedCameraPosValue(cameraId: string, axis: 'x' | 'y' | 'z'): number | undefined;
 
+  /**
+   * Get the quaternion [w, x, y, z] captured when the camera was added.
+   * Plain array snapshot, used when the quaternion is not optimized.
+   */
+  getLockedCameraQuatValues(cameraId: string): readonly [number, number, number, number];
+
   /**
    * Returns indices for camera intrinsics.
    * -1 for any non-optimized parameter (uses locked value).
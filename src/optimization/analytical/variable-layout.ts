@@ -10,7 +10,7 @@
 
 import type { WorldPoint } from '../../entities/world-point/WorldPoint';
 import type { IOptimizableCamera } from '../IOptimizable';
-import type { VariableLayout } from './types';
+import type { VariableLayout, CameraIntrinsicsIndices, CameraIntrinsicsValues } from './types';
 
 /**
  * Options for adding a camera to the layout.
@@ -21,6 +21,20 @@ export interface CameraLayoutOptions {
   optimizeDistortion?: boolean;
 }
 
+interface PointLayoutEntry {
+  indices: [number, number, number];
+  lockedValues: [number | null, number | null, number | null];
+}
+
+interface CameraLayoutEntry {
+  posIndices: [number, number, number];
+  posLockedValues: [number | null, number | null, number | null];
+  quatIndices: [number, number, number, number];
+  quatLockedValues: [number, number, number, number];
+  intrinsicsIndices: CameraIntrinsicsIndices;
+  intrinsicsValues: CameraIntrinsicsValues;
+}
+
 /**
  * Builder for constructing VariableLayout from entities.
  */
@@ -28,44 +42,12 @@ export class VariableLayoutBuilder {
   private nextIndex = 0;
   private values: number[] = [];
 
-  // Point indices: [x, y, z], -1 for locked
+  // One entry per world point: indices [x, y, z] (-1 for locked) and locked values.
   // Use WorldPoint objects as keys (not names) to handle duplicate names
-  private pointIndices = new Map<WorldPoint, [number, number, number]>();
-  private pointLockedValues = new Map<WorldPoint, [number | null, number | null, number | null]>();
+  private points = new Map<WorldPoint, PointLayoutEntry>();
 
-  // Camera position indices: [x, y, z], -1 for locked
-  private cameraPosIndices = new Map<string, [number, number, number]>();
-  private cameraPosLockedValues = new Map<string, [number | null, number | null, number | null]>();
-
-  // Camera quaternion indices: [w, x, y, z], -1 for locked
-  private cameraQuatIndices = new Map<string, [number, number, number, number]>();
-  private cameraQuatLockedValues = new Map<string, [number, number, number, number]>();
-
-  // Camera intrinsics indices (focal length, principal point, etc.)
-  private cameraIntrinsicsIndices = new Map<string, {
-    focalLength: number;
-    aspectRatio: number;
-    principalPointX: number;
-    principalPointY: number;
-    skew: number;
-    k1: number;
-    k2: number;
-    k3: number;
-    p1: number;
-    p2: number;
-  }>();
-  private cameraIntrinsicsValues = new Map<string, {
-    focalLength: number;
-    aspectRatio: number;
-    principalPointX: number;
-    principalPointY: number;
-    skew: number;
-    k1: number;
-    k2: number;
-    k3: number;
-    p1: number;
-    p2: number;
-  }>();
+  // One entry per camera, so every per-camera lookup is a single map hit
+  private cameras = new Map<string, CameraLayoutEntry>();
 
   /**
    * Add a world point to the layout.
@@ -91,12 +73,14 @@ export class VariableLayoutBuilder {
     const zIdx = zLocked ? -1 : this.allocate(optimizedXyz?.[2] ?? 0);
 
     // Use point object as key (not name or id) to handle duplicate names
-    this.pointIndices.set(point, [xIdx, yIdx, zIdx]);
-    this.pointLockedValues.set(point, [
-      xLocked ? xValue : null,
-      yLocked ? yValue : null,
-      zLocked ? zValue : null,
-    ]);
+    this.points.set(point, {
+      indices: [xIdx, yIdx, zIdx],
+      lockedValues: [
+        xLocked ? xValue : null,
+        yLocked ? yValue : null,
+        zLocked ? zValue : null,
+      ],
+    });
   }
 
   /**
@@ -118,8 +102,8 @@ export class VariableLayoutBuilder {
         ]
       : [-1, -1, -1];
 
-    this.cameraPosIndices.set(camera.name, posIndices);
-    this.cameraPosLockedValues.set(camera.name, optimizePose ? [null, null, null] : [...camera.position]);
+    const posLockedValues: [number | null, number | null, number | null] =
+      optimizePose ? [null, null, null] : [...camera.position];
 
     // Quaternion (rotation)
     const quatIndices: [number, number, number, number] = optimizePose
@@ -131,8 +115,7 @@ export class VariableLayoutBuilder {
         ]
       : [-1, -1, -1, -1];
 
-    this.cameraQuatIndices.set(camera.name, quatIndices);
-    this.cameraQuatLockedValues.set(camera.name, [...camera.rotation]);
+    const quatLockedValues: [number, number, number, number] = [...camera.rotation];
 
     // Intrinsics (for reprojection provider)
     // Must match Viewpoint.addToValueMap() logic exactly
@@ -163,7 +146,6 @@ export class VariableLayoutBuilder {
       p1: -1,
       p2: -1,
     };
-    this.cameraIntrinsicsIndices.set(camera.name, intrinsicsIndices);
 
     // Extract distortion coefficients from arrays
     const [k1, k2, k3] = camera.radialDistortion;
@@ -181,7 +163,15 @@ export class VariableLayoutBuilder {
       p1,
       p2,
     };
-    this.cameraIntrinsicsValues.set(camera.name, intrinsicsValues);
+
+    this.cameras.set(camera.name, {
+      posIndices,
+      posLockedValues,
+      quatIndices,
+      quatLockedValues,
+      intrinsicsIndices,
+      intrinsicsValues,
+    });
   }
 
   private allocate(initialValue: number): number {
@@ -197,62 +187,65 @@ export class VariableLayoutBuilder {
     const initialValues = new Float64Array(this.values);
 
     // Copy maps for closure
-    const pointIndices = new Map(this.pointIndices);
-    const pointLockedValues = new Map(this.pointLockedValues);
-    const cameraPosIndices = new Map(this.cameraPosIndices);
-    const cameraPosLockedValues = new Map(this.cameraPosLockedValues);
-    const cameraQuatIndices = new Map(this.cameraQuatIndices);
-    const cameraIntrinsicsIndices = new Map(this.cameraIntrinsicsIndices);
-    const cameraIntrinsicsValues = new Map(this.cameraIntrinsicsValues);
+    const points = new Map(this.points);
+    const cameras = new Map(this.cameras);
 
     return {
       numVariables,
       initialValues,
 
       getWorldPointIndices(point: WorldPoint): readonly [number, number, number] {
-        const indices = pointIndices.get(point);
-        if (!indices) {
+        const entry = points.get(point);
+        if (!entry) {
           throw new Error(`WorldPoint "${point.name}" not found in layout`);
         }
-        return indices;
+        return entry.indices;
       },
 
       getCameraPosIndices(cameraId: string): readonly [number, number, number] {
-        const indices = cameraPosIndices.get(cameraId);
-        if (!indices) {
+        const entry = cameras.get(cameraId);
+        if (!entry) {
           throw new Error(`Camera "${cameraId}" not found in layout`);
         }
-        return indices;
+        return entry.posIndices;
       },
 
       getCameraQuatIndices(cameraId: string): readonly [number, number, number, number] {
-        const indices = cameraQuatIndices.get(cameraId);
-        if (!indices) {
+        const entry = cameras.get(cameraId);
+        if (!entry) {
           throw new Error(`Camera "${cameraId}" not found in layout`);
         }
-        return indices;
+        return entry.quatIndices;
       },
 
       getLockedWorldPointValue(point: WorldPoint, axis: 'x' | 'y' | 'z'): number | undefined {
-        const locked = pointLockedValues.get(point);
-        if (!locked) return undefined;
+        const entry = points.get(point);
+        if (!entry) return undefined;
         const idx = axis === 'x' ? 0 : axis === 'y' ? 1 : 2;
-        return locked[idx] ?? undefined;
+        return entry.lockedValues[idx] ?? undefined;
       },
 
       getLockedCameraPosValue(cameraId: string, axis: 'x' | 'y' | 'z'): number | undefined {
-        const locked = cameraPosLockedValues.get(cameraId);
-        if (!locked) return undefined;
+        const entry = cameras.get(cameraId);
+        if (!entry) return undefined;
         const idx = axis === 'x' ? 0 : axis === 'y' ? 1 : 2;
-        return locked[idx] ?? undefined;
+        return entry.posLockedValues[idx] ?? undefined;
+      },
+
+      getLockedCameraQuatValues(cameraId: string): readonly [number, number, number, number] {
+        const entry = cameras.get(cameraId);
+        if (!entry) {
+          throw new Error(`Camera "${cameraId}" not found in layout`);
+        }
+        return entry.quatLockedValues;
       },
 
       getCameraIntrinsicsIndices(cameraId: string) {
-        return cameraIntrinsicsIndices.get(cameraId);
+        return cameras.get(cameraId)?.intrinsicsIndices;
       },
 
       getCameraIntrinsicsValues(cameraId: string) {
-        return cameraIntrinsicsValues.get(cameraId);
+        return cameras.get(cameraId)?.intrinsicsValues;
       },
     };
   }
@@ -272,7 +265,7 @@ export class VariableLayoutBuilder {
     p1: number;
     p2: number;
   } | undefined {
-    return this.cameraIntrinsicsValues.get(cameraId);
+    return this.cameras.get(cameraId)?.intrinsicsValues;
   }
 
   /**
@@ -9,7 +9,11 @@
 import { SparseMatrix } from './sparse/SparseMatrix';
 import { conjugateGradientDamped } from './sparse/cg-solvers';
 import type { AnalyticalResidualProvider } from './analytical/types';
-import { accumulateNormalEquations } from './analytical/accumulate-normal-equations';
+import {
+  accumulateNormalEquations,
+  buildNormalEquationsPattern,
+  createNormalEquationsBuffers,
+} from './analytical/accumulate-normal-equations';
 
 /**
  * Options for nonlinear least squares solver.
@@ -49,8 +53,8 @@ export interface TransparentLMResult extends NonlinearLeastSquaresResult {
   jacobian: number[][];
   /** Final residual values */
   residualValues: number[];
-  /** Final variable values */
-  variableValues: number[];
+  /** Final variable values (the solver's own buffer; not shared with the caller) */
+  variableValues: Float64Array;
 }
 
 /**
@@ -154,14 +158,17 @@ function solveFromNormalEquations(
 
 /**
  * Compute cost (sum of squared residuals) from analytical providers.
+ * When residualsOut is given, the individual residuals are written to it.
  */
 function computeCostFromProviders(
   variables: Float64Array,
-  providers: readonly AnalyticalResidualProvider[]
+  providers: readonly AnalyticalResidualProvider[],
+  residualsOut?: Float64Array
 ): number {
   let cost = 0;
-  for (const provider of providers) {
-    const r = provider.computeResidual(variables);
+  for (let p = 0; p < providers.length; p++) {
+    const r = providers[p].computeResidual(variables);
+    if (residualsOut) residualsOut[p] = r;
     cost += r * r;
   }
   return cost;
@@ -242,8 +249,15 @@ export function transparentLM(
   const startTime = performance.now();
   const maxInnerIterations = 10;
 
+  // Pick the linear solver once rather than branching on every damping attempt
+  const solveNormalEquations = useSparseLinearSolve
+    ? solveSparseFromNormalEquations
+    : solveFromNormalEquations;
+
   // Copy initial values to working array
   const variables = new Float64Array(initialValues);
+  // Snapshot buffer for rejected steps, reused across iterations
+  const oldValues = new Float64Array(numVariables);
 
   // Validate analytical providers have valid variable indices
   for (let i = 0; i < analyticalProviders.length; i++) {
@@ -288,12 +302,29 @@ export function transparentLM(
     }
   };
 
+  // Providers whose variables are all locked have a fixed residual: evaluate
+  // them once and iterate only over the providers that can change
+  const activeProviders: AnalyticalResidualProvider[] = [];
+  let constantCost = 0;
+  for (const provider of analyticalProviders) {
+    if (provider.variableIndices.some(idx => idx >= 0)) {
+      activeProviders.push(provider);
+    } else {
+      const r = provider.computeResidual(variables);
+      constantCost += r * r;
+    }
+  }
+
+  // The J^T J sparsity pattern is fixed by the providers, so build it once
+  const jtjPattern = buildNormalEquationsPattern(activeProviders, numVariables);
+  // negJtr and residual buffers, overwritten by each accumulation
+  const normalEqBuffers = createNormalEquationsBuffers(activeProviders.length, numVariables);
+
   let prevCost = Infinity;
   let lambda = initialDamping;
   let converged = false;
   let convergenceReason = 'Max iterations reached';
   let iterations = 0;
-  let residuals: number[] = [];
   let cost = 0;
 
   for (let iter = 0; iter < maxIterations; iter++) {
@@ -302,13 +333,14 @@ export function transparentLM(
     // Compute normal equations from analytical providers
     const normalEqs = accumulateNormalEquations(
       variables,
-      analyticalProviders,
-      numVariables
+      activeProviders,
+      numVariables,
+      jtjPattern,
+      normalEqBuffers
     );
     const JtJ = normalEqs.JtJ;
     const negJtr = normalEqs.negJtr;
-    cost = normalEqs.cost;
-    residuals = Array.from(normalEqs.residuals);
+    cost = normalEqs.cost + constantCost;
 
     // Gradient norm: ||J^T r|| = ||negJtr|| (since negJtr = -J^T r)
     const gradientNorm = Math.sqrt(negJtr.reduce((sum, g) => sum + g * g, 0));
@@ -346,9 +378,7 @@ export function transparentLM(
       const effectiveLambda = adaptiveDamping ? lambda : 0;
 
       // Solve normal equations
-      const delta = useSparseLinearSolve
-        ? solveSparseFromNormalEquations(JtJ, negJtr, effectiveLambda, numVariables)
-        : solveFromNormalEquations(JtJ, negJtr, effectiveLambda, numVariables);
+      const delta = solveNormalEquations(JtJ, negJtr, effectiveLambda, numVariables);
 
       // Check step size
       const deltaNorm = Math.sqrt(delta.reduce((sum, d) => sum + d * d, 0));
@@ -359,13 +389,13 @@ export function transparentLM(
       }
 
       // Save old values and apply step
-      const oldValues = new Float64Array(variables);
+      oldValues.set(variables);
       for (let j = 0; j < numVariables; j++) {
         variables[j] = oldValues[j] + delta[j];
       }
 
       // Compute new cost
-      const newCost = computeCostFromProviders(variables, analyticalProviders);
+      const newCost = computeCostFromProviders(variables, activeProviders) + constantCost;
 
       if (adaptiveDamping) {
         if (newCost < cost) {
@@ -398,14 +428,10 @@ export function transparentLM(
     prevCost = cost;
   }
 
-  // Final cost computation
-  const finalNormalEqs = accumulateNormalEquations(
-    variables,
-    analyticalProviders,
-    numVariables
-  );
-  const finalCost = finalNormalEqs.cost;
-  residuals = Array.from(finalNormalEqs.residuals);
+  // Final cost computation (residuals only: no gradients or J^T J needed here)
+  const finalResiduals = new Float64Array(analyticalProviders.length);
+  const finalCost = computeCostFromProviders(variables, analyticalProviders, finalResiduals);
+  const residuals = Array.from(finalResiduals);
 
   const computationTime = performance.now() - startTime;
 
@@ -429,7 +455,7 @@ export function transparentLM(
     computationTime,
     jacobian: [],  // Not materialized in analytical solve
     residualValues: residuals,
-    variableValues: Array.from(variables),
+    variableValues: variables,
   };
 }
 
@@ -129,40 +129,37 @@ export class ConstraintSystem {
    * and which residual index within that entity's lastResiduals array.
    *
    * @param providers - The analytical providers with owner info
-   * @param variables - The final variable values after solve
+   * @param residuals - Final residual of each provider, in provider order
+   *   (the solver's residualValues, so nothing is re-evaluated here)
    */
   private distributeResiduals(
     providers: AnalyticalResidualProvider[],
-    variables: Float64Array
+    residuals: readonly number[]
   ): void {
-    // Group residuals by owner entity
-    const entityResiduals = new Map<unknown, { maxIndex: number; values: Map<number, number> }>();
+    // Group residuals by owner entity, writing straight into each entity's array
+    const entityResiduals = new Map<unknown, number[]>();
 
-    for (const provider of providers) {
-      if (!provider.owner) continue;
+    for (let p = 0; p < providers.length; p++) {
+      const owner = providers[p].owner;
+      if (!owner) continue;
 
-      const { entity, residualIndex } = provider.owner;
-      const residualValue = provider.computeResidual(variables);
-
-      if (!entityResiduals.has(entity)) {
-        entityResiduals.set(entity, { maxIndex: -1, values: new Map() });
+      let values = entityResiduals.get(owner.entity);
+      if (!values) {
+        values = [];
+        entityResiduals.set(owner.entity, values);
       }
 
-      const entry = entityResiduals.get(entity)!;
-      entry.values.set(residualIndex, residualValue);
-      entry.maxIndex = Math.max(entry.maxIndex, residualIndex);
-    }
-
-    // Assign residuals to each entity's lastResiduals array
-    for (const [entity, { maxIndex, values }] of entityResiduals) {
-      const residualsArray = new Array<number>(maxIndex + 1).fill(0);
-      for (const [idx, val] of values) {
-        residualsArray[idx] = val;
+      // Missing indices read as 0
+      while (values.length < owner.residualIndex) {
+        values.push(0);
       }
+      values[owner.residualIndex] = residuals[p];
+    }
 
-      // Set lastResiduals on the entity (Line, Constraint, or ImagePoint)
+    // Set lastResiduals on each entity (Line, Constraint, or ImagePoint)
+    for (const [entity, values] of entityResiduals) {
       if ('lastResiduals' in (entity as object)) {
-        (entity as { lastResiduals: number[] }).lastResiduals = residualsArray;
+        (entity as { lastResiduals: number[] }).lastResiduals = values;
       }
     }
   }
@@ -277,8 +274,8 @@ export class ConstraintSystem {
         quaternionIndices: quaternionIndices.length > 0 ? quaternionIndices : undefined,
       });
 
-      // Get final variables from solver result
-      const finalVariables = new Float64Array(result.variableValues);
+      // Final variables from solver result (already a packed Float64Array)
+      const finalVariables = result.variableValues;
 
       // Update points with solved values (using Phase 4 variable-based approach)
       for (const point of this.points) {
@@ -313,7 +310,7 @@ export class ConstraintSystem {
 
       // Distribute residuals from analytical providers to entities
       // This replaces the old computeResiduals calls on lines, constraints, and image points
-      this.distributeResiduals(providers, finalVariables);
+      this.distributeResiduals(providers, result.residualValues);
 
       // Use final cost from analytical solver (already computed as sum of squared residuals)
       const residualMagnitude = Math.sqrt(result.finalCost);
@@ -375,18 +372,27 @@ export class ConstraintSystem {
     const layout = builder.build();
 
     // Helper to get point indices and locked values
-    // Uses WorldPoint object directly (not name or id) to handle duplicate names
-    const getPointInfo = (point: WorldPoint): {
+    // Uses WorldPoint object directly (not name or id) to handle duplicate names.
+    // Points are shared by many lines, constraints and image points, so the
+    // result is computed once per point and reused.
+    type PointInfo = {
       indices: readonly [number, number, number];
       locked: readonly [number | null, number | null, number | null];
-    } => {
-      const indices = layout.getWorldPointIndices(point);
-      const locked: [number | null, number | null, number | null] = [
-        layout.getLockedWorldPointValue(point, 'x') ?? null,
-        layout.getLockedWorldPointValue(point, 'y') ?? null,
-        layout.getLockedWorldPointValue(point, 'z') ?? null,
-      ];
-      return { indices, locked };
+    };
+    const pointInfoCache = new Map<WorldPoint, PointInfo>();
+    const getPointInfo = (point: WorldPoint): PointInfo => {
+      let info = pointInfoCache.get(point);
+      if (!info) {
+        const indices = layout.getWorldPointIndices(point);
+        const locked: [number | null, number | null, number | null] = [
+          layout.getLockedWorldPointValue(point, 'x') ?? null,
+          layout.getLockedWorldPointValue(point, 'y') ?? null,
+          layout.getLockedWorldPointValue(point, 'z') ?? null,
+        ];
+        info = { indices, locked };
+        pointInfoCache.set(point, info);
+      }
+      return info;
     };
 
     // Geometric scale for direction/length residuals (same as Line.computeResiduals)
@@ -494,69 +500,91 @@ export class ConstraintSystem {
     }
 
     // 5. Add reprojection providers for image points
+    // Everything except the observation depends only on the camera, so it is
+    // built once per camera and shared by all of that camera's image points
+    // (null when the camera has no intrinsics in the layout).
+    const reprojectionCameras = new Map<string, {
+      posIndices: readonly [number, number, number];
+      quatIndices: readonly [number, number, number, number];
+      intrinsics: CameraIntrinsics;
+      intrinsicsIndices: CameraIntrinsicsIndices | undefined;
+      getCameraPos: (variables: Float64Array) => { x: number; y: number; z: number };
+      getQuat: (variables: Float64Array) => { w: number; x: number; y: number; z: number };
+      flags: ReprojectionFlags;
+    } | null>();
+
     for (const imagePoint of this.imagePoints) {
       const worldPointInfo = getPointInfo(imagePoint.worldPoint);
       const camera = imagePoint.viewpoint;
 
-      const posIndices = layout.getCameraPosIndices(camera.name);
-      const quatIndices = layout.getCameraQuatIndices(camera.name);
-
-      // Get camera intrinsics values from builder
-      const intrinsics = builder.getCameraIntrinsics(camera.name);
-      if (!intrinsics) continue;
-
-      // CameraIntrinsics uses fx, fy, cx, cy format
-      const cameraIntrinsics: CameraIntrinsics = {
-        fx: intrinsics.focalLength,
-        fy: intrinsics.focalLength * intrinsics.aspectRatio,
-        cx: intrinsics.principalPointX,
-        cy: intrinsics.principalPointY,
-        k1: intrinsics.k1,
-        k2: intrinsics.k2,
-        k3: intrinsics.k3,
-        p1: intrinsics.p1,
-        p2: intrinsics.p2,
-      };
+      let cameraInfo = reprojectionCameras.get(camera.name);
+      if (cameraInfo === undefined) {
+        const posIndices = layout.getCameraPosIndices(camera.name);
+        const quatIndices = layout.getCameraQuatIndices(camera.name);
 
-      // Get intrinsics indices from layout (for optimizing intrinsics)
-      const layoutIntrinsicsIndices = layout.getCameraIntrinsicsIndices(camera.name);
-      const intrinsicsIndices: CameraIntrinsicsIndices | undefined = layoutIntrinsicsIndices
-        ? {
-            focalLength: layoutIntrinsicsIndices.focalLength,
-            cx: layoutIntrinsicsIndices.principalPointX,
-            cy: layoutIntrinsicsIndices.principalPointY,
-          }
-        : undefined;
-
-      // Build locked values for camera position
-      const posLocked: [number | null, number | null, number | null] = [
-        layout.getLockedCameraPosValue(camera.name, 'x') ?? null,
-        layout.getLockedCameraPosValue(camera.name, 'y') ?? null,
-        layout.getLockedCameraPosValue(camera.name, 'z') ?? null,
-      ];
-
-      // Quaternion locked values
-      const quatLocked: [number, number, number, number] = [...camera.rotation];
-
-      // Build reprojection flags
-      // When useIsZReflected is true and camera.isZReflected is true, negate camera coordinates
-      const reprojectionFlags: ReprojectionFlags = {
-        isZReflected: this.useIsZReflected && camera.isZReflected,
-      };
+        // Get camera intrinsics values from builder
+        const intrinsics = builder.getCameraIntrinsics(camera.name);
+        if (!intrinsics) {
+          cameraInfo = null;
+        } else {
+          // Get intrinsics indices from layout (for optimizing intrinsics)
+          const layoutIntrinsicsIndices = layout.getCameraIntrinsicsIndices(camera.name);
+
+          // Build locked values for camera position
+          const posLocked: [number | null, number | null, number | null] = [
+            layout.getLockedCameraPosValue(camera.name, 'x') ?? null,
+            layout.getLockedCameraPosValue(camera.name, 'y') ?? null,
+            layout.getLockedCameraPosValue(camera.name, 'z') ?? null,
+          ];
+
+          // Quaternion locked values (plain snapshot taken once by the layout)
+          const quatLocked = layout.getLockedCameraQuatValues(camera.name);
+
+          cameraInfo = {
+            posIndices,
+            quatIndices,
+            // CameraIntrinsics uses fx, fy, cx, cy format
+            intrinsics: {
+              fx: intrinsics.focalLength,
+              fy: intrinsics.focalLength * intrinsics.aspectRatio,
+              cx: intrinsics.principalPointX,
+              cy: intrinsics.principalPointY,
+              k1: intrinsics.k1,
+              k2: intrinsics.k2,
+              k3: intrinsics.k3,
+              p1: intrinsics.p1,
+              p2: intrinsics.p2,
+            },
+            intrinsicsIndices: layoutIntrinsicsIndices
+              ? {
+                  focalLength: layoutIntrinsicsIndices.focalLength,
+                  cx: layoutIntrinsicsIndices.principalPointX,
+                  cy: layoutIntrinsicsIndices.principalPointY,
+                }
+              : undefined,
+            getCameraPos: createPointGetter(posIndices, posLocked),
+            getQuat: createQuaternionGetter(quatIndices, quatLocked),
+            // When useIsZReflected is true and camera.isZReflected is true, negate camera coordinates
+            flags: { isZReflected: this.useIsZReflected && camera.isZReflected },
+          };
+        }
+        reprojectionCameras.set(camera.name, cameraInfo);
+      }
+      if (!cameraInfo) continue;
 
       // createReprojectionProviders takes observation as an object
       // Returns 2 providers: [u residual, v residual]
       const reprojectionProviders = createReprojectionProviders(
         worldPointInfo.indices,
-        posIndices,
-        quatIndices,
-        cameraIntrinsics,
+        cameraInfo.posIndices,
+        cameraInfo.quatIndices,
+        cameraInfo.intrinsics,
         { observedU: imagePoint.u, observedV: imagePoint.v },
         createPointGetter(worldPointInfo.indices, worldPointInfo.locked),
-        createPointGetter(posIndices, posLocked),
-        createQuaternionGetter(quatIndices, quatLocked),
-        intrinsicsIndices,
-        reprojectionFlags
+        cameraInfo.getCameraPos,
+        cameraInfo.getQuat,
+        cameraInfo.intrinsicsIndices,
+        cameraInfo.flags
       );
       // ImagePoint residuals: [du, dv] at indices 0, 1
       for (let i = 0; i < reprojectionProviders.length; i++) {
@@ -569,7 +597,7 @@ export class ConstraintSystem {
       if (!camera.vanishingLines || camera.vanishingLines.size === 0) continue;
 
       const quatIndices = layout.getCameraQuatIndices(camera.name);
-      const quatLocked: [number, number, number, number] = [...camera.rotation];
+      const quatLocked = layout.getLockedCameraQuatValues(camera.name);
       const getQuat = createQuaternionGetter(quatIndices, quatLocked);
 
       // Get camera intrinsics for VP-to-normalized conversion
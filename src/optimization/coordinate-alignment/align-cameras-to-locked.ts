@@ -113,6 +113,7 @@ export function alignCamerasToLockedPoints(
     target0[2] - rotated_scaled_tri0[2]
   ];
 
+  const rotInverse = quaternionInverse(rotation);
   for (const cam of cameras) {
     const oldPos = cam.position;
     const oldRot = cam.rotation;
@@ -125,7 +126,6 @@ export function alignCamerasToLockedPoints(
       rotatedPos[2] + translation[2]
     ];
 
-    const rotInverse = quaternionInverse(rotation);
     const newRot = quaternionMultiply(oldRot, rotInverse);
 
     cam.position = [newPos[0], newPos[1], newPos[2]];
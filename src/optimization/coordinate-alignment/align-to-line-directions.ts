@@ -34,9 +34,9 @@ export function alignSceneToLineDirections(
 ): AlignmentResult {
   // Helper to apply a rotation to the entire scene
   const applyRotation = (rotation: number[]) => {
+    const rotInverse = quaternionInverse(rotation);
     for (const cam of cameras) {
       const newPos = quaternionRotateVector(rotation, cam.position);
-      const rotInverse = quaternionInverse(rotation);
       const newRot = quaternionMultiply(cam.rotation, rotInverse);
       cam.position = [newPos[0], newPos[1], newPos[2]];
       cam.rotation = [newRot[0], newRot[1], newRot[2], newRot[3]];
@@ -411,11 +411,12 @@ export function alignSceneToLineDirections(
 
           // Create rotation quaternion around target axis
           const halfAngle = angle / 2;
+          const sinHalf = Math.sin(halfAngle);
           const axisRotation: number[] = [
             Math.cos(halfAngle),
-            Math.sin(halfAngle) * targetAxis[0],
-            Math.sin(halfAngle) * targetAxis[1],
-            Math.sin(halfAngle) * targetAxis[2]
+            sinHalf * targetAxis[0],
+            sinHalf * targetAxis[1],
+            sinHalf * targetAxis[2]
           ];
 
           // Apply this additional rotation
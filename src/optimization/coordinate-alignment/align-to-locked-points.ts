@@ -176,6 +176,7 @@ export function alignSceneToLockedPoints(
   // Apply transformation: new = R * scale * (old - srcCentroid) + dstCentroid
 
   // Transform cameras
+  const rotInverse = quaternionInverse(rotation);
   for (const cam of cameras) {
     const oldPos = cam.position;
     const oldRot = cam.rotation;
@@ -199,7 +200,6 @@ export function alignSceneToLockedPoints(
     ];
 
     // Rotate camera orientation
-    const rotInverse = quaternionInverse(rotation);
     const newRot = quaternionMultiply(oldRot, rotInverse);
 
     cam.position = [newPos[0], newPos[1], newPos[2]];
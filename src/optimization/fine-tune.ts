@@ -89,6 +89,7 @@ export function fineTuneProject(project: Project, options: FineTuneOptions = {})
     if (initializedCameras.length === 0) {
       log(`[FineTune] ERROR: No cameras have valid positions - run full optimization first`)
     }
+    const initializedCameraSet = new Set(initializedCameras)
 
     let pointsInitialized = 0
     let pointsAlreadyInitialized = 0
@@ -128,7 +129,7 @@ export function fineTuneProject(project: Project, options: FineTuneOptions = {})
       // Try to triangulate from image observations
       const imagePoints = Array.from(point.imagePoints) as ImagePoint[]
       const observationsWithValidCameras = imagePoints.filter(ip =>
-        initializedCameras.includes(ip.viewpoint as Viewpoint)
+        initializedCameraSet.has(ip.viewpoint as Viewpoint)
       )
 
       if (observationsWithValidCameras.length >= 2) {
@@ -7,11 +7,19 @@
  * Normalize a vector.
  */
 export function normalize(v: number[]): number[] {
-  const norm = Math.sqrt(v.reduce((sum, x) => sum + x * x, 0))
+  let normSq = 0
+  for (let i = 0; i < v.length; i++) {
+    normSq += v[i] * v[i]
+  }
+  const norm = Math.sqrt(normSq)
   if (norm < 1e-10) {
     return v
   }
-  return v.map(x => x / norm)
+  const result = new Array<number>(v.length)
+  for (let i = 0; i < v.length; i++) {
+    result[i] = v[i] / norm
+  }
+  return result
 }
 
 /**
@@ -135,28 +143,43 @@ export function solveLinearSystem3x3(A: number[][], b: number[]): number[] | nul
  * Multiply two 3x3 matrices.
  */
 export function matrixMultiply3x3(A: number[][], B: number[][]): number[][] {
-  const result: number[][] = [
-    [0, 0, 0],
-    [0, 0, 0],
-    [0, 0, 0]
-  ]
-
-  for (let i = 0; i < 3; i++) {
-    for (let j = 0; j < 3; j++) {
-      for (let k = 0; k < 3; k++) {
-        result[i][j] += A[i][k] * B[k][j]
-      }
-    }
-  }
+  const a0 = A[0], a1 = A[1], a2 = A[2]
+  const b0 = B[0], b1 = B[1], b2 = B[2]
 
-  return result
+  return [
+    [
+      a0[0] * b0[0] + a0[1] * b1[0] + a0[2] * b2[0],
+      a0[0] * b0[1] + a0[1] * b1[1] + a0[2] * b2[1],
+      a0[0] * b0[2] + a0[1] * b1[2] + a0[2] * b2[2]
+    ],
+    [
+      a1[0] * b0[0] + a1[1] * b1[0] + a1[2] * b2[0],
+      a1[0] * b0[1] + a1[1] * b1[1] + a1[2] * b2[1],
+      a1[0] * b0[2] + a1[1] * b1[2] + a1[2] * b2[2]
+    ],
+    [
+      a2[0] * b0[0] + a2[1] * b1[0] + a2[2] * b2[0],
+      a2[0] * b0[1] + a2[1] * b1[1] + a2[2] * b2[1],
+      a2[0] * b0[2] + a2[1] * b1[2] + a2[2] * b2[2]
+    ]
+  ]
 }
 
 /**
  * Multiply matrix by vector.
  */
 export function matrixVectorMultiply(M: number[][], v: number[]): number[] {
-  return M.map(row => row.reduce((sum, val, i) => sum + val * v[i], 0))
+  const rows = M.length
+  const result = new Array<number>(rows)
+  for (let i = 0; i < rows; i++) {
+    const row = M[i]
+    let sum = 0
+    for (let j = 0; j < row.length; j++) {
+      sum += row[j] * v[j]
+    }
+    result[i] = sum
+  }
+  return result
 }
 
 /**
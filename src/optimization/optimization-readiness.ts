@@ -52,17 +52,35 @@ export function checkOptimizationReadiness(project: Project): OptimizationReadin
   // Only count enabled viewpoints for optimization readiness
   const viewpointArray = Array.from(project.viewpoints.values()).filter(vp => vp.enabledInSolve)
 
-  const unlockedPoints = pointArray.filter(p => !p.isLocked())
-  const totalDOF = (unlockedPoints.length * 3) + (viewpointArray.length * 6)
+  // Tally per-point facts in a single pass; several checks below reuse them
+  let unlockedPointCount = 0
+  let hasAxisLockedPoints = false
+  // Use isFullyConstrained() to match what initialization and optimization use
+  const constrainedPoints: WorldPoint[] = []
+  for (const p of pointArray) {
+    if (!p.isLocked()) {
+      unlockedPointCount++
+    }
+    if (p.isFullyConstrained()) {
+      constrainedPoints.push(p)
+    }
+    const xyz = p.lockedXyz
+    if (xyz[0] !== null || xyz[1] !== null || xyz[2] !== null) {
+      hasAxisLockedPoints = true
+    }
+  }
+  const totalDOF = (unlockedPointCount * 3) + (viewpointArray.length * 6)
 
   // Count intrinsic line constraints (direction and length)
   let lineConstraintCount = 0
+  let hasLengthConstraint = false
   for (const line of lineArray) {
     if (line.direction !== 'free') {
       lineConstraintCount += 2
     }
     if (line.hasFixedLength()) {
       lineConstraintCount += 1
+      hasLengthConstraint = true
     }
   }
 
@@ -70,19 +88,26 @@ export function checkOptimizationReadiness(project: Project): OptimizationReadin
   const netDOF = Math.max(0, totalDOF - constraintDOF)
 
   // Count projection constraints
-  const projectionCount = Array.from(project.constraints).filter(
-    c => c.getConstraintType() === 'projection_point_camera'
-  ).length
+  let projectionCount = 0
+  for (const c of project.constraints) {
+    if (c.getConstraintType() === 'projection_point_camera') {
+      projectionCount++
+    }
+  }
 
   // Count image observations from fully constrained world points (valid for PnP)
   // Use isFullyConstrained() to match what initialization actually does
   let pnpObservationCount = 0
+  let maxPnpObservationsPerCamera = 0
   for (const vp of viewpointArray) {
+    let vpObservationCount = 0
     for (const ip of vp.imagePoints) {
       if (ip.worldPoint.isFullyConstrained()) {
-        pnpObservationCount++
+        vpObservationCount++
       }
     }
+    pnpObservationCount += vpObservationCount
+    maxPnpObservationsPerCamera = Math.max(maxPnpObservationsPerCamera, vpObservationCount)
   }
 
   // Track issues
@@ -109,7 +134,7 @@ export function checkOptimizationReadiness(project: Project): OptimizationReadin
 
   // Check basic requirements
   const effectiveConstraintCount = project.constraints.size + lineConstraintCount + pnpObservationCount
-  const hasEnoughEntities = unlockedPoints.length > 0 || viewpointArray.length > 0
+  const hasEnoughEntities = unlockedPointCount > 0 || viewpointArray.length > 0
 
   if (!hasEnoughEntities) {
     issues.push({
@@ -134,39 +159,23 @@ export function checkOptimizationReadiness(project: Project): OptimizationReadin
   const camerasNeedingInit = viewpointArray.length
 
   if (camerasNeedingInit >= 2) {
-    // Use isFullyConstrained() to match what initialization actually does
-    const constrainedPoints = pointArray.filter(wp => wp.isFullyConstrained())
-
-    let anyCameraCanUsePnP = false
-    if (constrainedPoints.length >= 2) {
-      // Check if at least one camera can use PnP: needs 3+ constrained points visible
-      for (const vp of viewpointArray) {
-        const vpConcrete = vp as Viewpoint
-        const vpConstrainedPoints = Array.from(vpConcrete.imagePoints).filter(ip =>
-          (ip.worldPoint as WorldPoint).isFullyConstrained()
-        )
-
-        if (vpConstrainedPoints.length >= 3) {
-          anyCameraCanUsePnP = true
-          break
-        }
-      }
-    }
+    // At least one camera can use PnP if it sees 3+ constrained points
+    const anyCameraCanUsePnP = constrainedPoints.length >= 2 && maxPnpObservationsPerCamera >= 3
 
     // Check if any camera can use vanishing point initialization
     // This includes both explicit VanishingLines AND direction-constrained Lines
     let anyCameraCanUseVanishingPoints = false
     if (!anyCameraCanUsePnP) {
-      // Check if there's a scale reference from distance constraints
-      const hasScaleReference = lineArray.some(l => l.hasFixedLength())
-      // With a scale reference, only 1 locked point is needed instead of 2
-      const allowSinglePoint = hasScaleReference
+      // With a scale reference from distance constraints, only 1 locked point
+      // is needed instead of 2
+      const allowSinglePoint = hasLengthConstraint
+      const pointSet = new Set(pointArray)
 
       for (const vp of viewpointArray) {
         const vpConcrete = vp as Viewpoint
         // Use the function from vanishing-points module which also considers
         // direction-constrained Lines as virtual vanishing lines
-        if (canInitializeWithVanishingPoints(vpConcrete, new Set(pointArray), { allowSinglePoint })) {
+        if (canInitializeWithVanishingPoints(vpConcrete, pointSet, { allowSinglePoint })) {
           anyCameraCanUseVanishingPoints = true
           break
         }
@@ -200,9 +209,7 @@ export function checkOptimizationReadiness(project: Project): OptimizationReadin
   }
 
   // Check for scale constraint (at least one constrained point or length constraint)
-  // Use isFullyConstrained() to match what optimization actually uses
-  const hasConstrainedPoint = pointArray.some(p => p.isFullyConstrained())
-  const hasLengthConstraint = lineArray.some(l => l.hasFixedLength())
+  const hasConstrainedPoint = constrainedPoints.length > 0
   if (!hasConstrainedPoint && !hasLengthConstraint && viewpointArray.length > 0) {
     issues.push({
       type: 'warning',
@@ -214,10 +221,6 @@ export function checkOptimizationReadiness(project: Project): OptimizationReadin
 
   // Check for axis definition (vanishing lines or locked coordinates)
   const hasVanishingLines = viewpointArray.some(vp => vp.vanishingLines.size > 0)
-  const hasAxisLockedPoints = pointArray.some(p => {
-    const xyz = p.lockedXyz
-    return xyz[0] !== null || xyz[1] !== null || xyz[2] !== null
-  })
   if (!hasVanishingLines && !hasAxisLockedPoints && viewpointArray.length > 0) {
     issues.push({
       type: 'warning',
@@ -260,7 +263,6 @@ export function checkOptimizationReadiness(project: Project): OptimizationReadin
 
   // Check for duplicate positions among fully constrained points
   const DUPLICATE_TOLERANCE = 0.001
-  const constrainedPoints = pointArray.filter(p => p.isFullyConstrained())
   const duplicatePairs: Array<[WorldPoint, WorldPoint, number]> = []
 
   for (let i = 0; i < constrainedPoints.length; i++) {
@@ -298,7 +300,7 @@ export function checkOptimizationReadiness(project: Project): OptimizationReadin
 
   return {
     pointCount: pointArray.length,
-    unlockedPointCount: unlockedPoints.length,
+    unlockedPointCount,
     lineCount: lineArray.length,
     viewpointCount: viewpointArray.length,
     constraintCount: project.constraints.size,
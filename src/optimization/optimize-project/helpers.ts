@@ -77,6 +77,22 @@ export function restoreSolverState(snapshot: SolverStateSnapshot): void {
   }
 }
 
+const POINT_FIELD_NAMES = ['pointA', 'pointB', 'pointC', 'vertex'] as const;
+
+// Individual point properties per constraint class. Constraints assign these
+// once in their constructors, so the first instance seen settles the class.
+const pointFieldsByClass = new Map<Function, readonly string[]>();
+
+function getPointFields(constraint: Constraint): readonly string[] {
+  let fields = pointFieldsByClass.get(constraint.constructor);
+  if (!fields) {
+    const c = constraint as unknown as Record<string, unknown>;
+    fields = POINT_FIELD_NAMES.filter(name => c[name] !== null && typeof c[name] === 'object');
+    pointFieldsByClass.set(constraint.constructor, fields);
+  }
+  return fields;
+}
+
 /**
  * Get all WorldPoints referenced by a constraint.
  * Handles both `points` array (coplanar, collinear) and individual point properties (distance, angle).
@@ -86,14 +102,9 @@ function getConstraintPoints(constraint: Constraint): WorldPoint[] {
   if (hasPointsField(constraint)) {
     return constraint.points;
   }
-  // Check for individual point properties (distance: pointA/pointB, angle: pointA/vertex/pointC)
-  const points: WorldPoint[] = [];
-  const c = constraint as unknown as Record<string, unknown>;
-  if (c.pointA && typeof c.pointA === 'object') points.push(c.pointA as WorldPoint);
-  if (c.pointB && typeof c.pointB === 'object') points.push(c.pointB as WorldPoint);
-  if (c.pointC && typeof c.pointC === 'object') points.push(c.pointC as WorldPoint);
-  if (c.vertex && typeof c.vertex === 'object') points.push(c.vertex as WorldPoint);
-  return points;
+  // Individual point properties (distance: pointA/pointB, angle: pointA/vertex/pointC)
+  const c = constraint as unknown as Record<string, WorldPoint>;
+  return getPointFields(constraint).map(name => c[name]);
 }
 
 /**
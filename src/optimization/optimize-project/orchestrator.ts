@@ -160,7 +160,7 @@ export async function optimizeProject(
     if (uninitializedCameras.length >= 1 && autoInitializeCameras) {
       const lockedPoints = worldPointArray.filter(wp => wp.isFullyConstrained());
 
-      const validation = validateProjectConstraints(project);
+      const validation = validateProjectConstraints(project, lockedPoints);
       if (!validation.valid) {
         throw new Error(validation.error!);
       }
@@ -43,12 +43,15 @@ export function detectOutliers(
     }
   }
 
-  errors.sort((a, b) => a - b);
+  let sumError = 0;
+  let sumSquaredError = 0;
+  for (const e of errors) {
+    sumError += e;
+    sumSquaredError += e * e;
+  }
 
   // Return undefined when no data — 0 would falsely indicate "perfect"
-  const medianError = errors.length > 0 ? errors[Math.floor(errors.length / 2)] : undefined;
-  const sumError = errors.reduce((sum, e) => sum + e, 0);
-  const sumSquaredError = errors.reduce((sum, e) => sum + e * e, 0);
+  const medianError = errors.length > 0 ? selectKth(errors, Math.floor(errors.length / 2)) : undefined;
   const meanError = errors.length > 0 ? sumError / errors.length : undefined;
   const rmsError = errors.length > 0 ? Math.sqrt(sumSquaredError / errors.length) : undefined;
 
@@ -73,3 +76,36 @@ export function detectOutliers(
 
   return { outliers, medianError, meanError, rmsError, actualThreshold: outlierThreshold };
 }
+
+/**
+ * Return the k-th smallest value (0-based) using in-place quickselect.
+ * O(N) on average instead of the O(N log N) full sort; reorders `values`.
+ */
+function selectKth(values: number[], k: number): number {
+  let lo = 0;
+  let hi = values.length - 1;
+  while (lo < hi) {
+    const pivot = values[(lo + hi) >> 1];
+    let i = lo;
+    let j = hi;
+    while (i <= j) {
+      while (values[i] < pivot) i++;
+      while (values[j] > pivot) j--;
+      if (i <= j) {
+        const tmp = values[i];
+        values[i] = values[j];
+        values[j] = tmp;
+        i++;
+        j--;
+      }
+    }
+    if (k <= j) {
+      hi = j;
+    } else if (k >= i) {
+      lo = i;
+    } else {
+      break;
+    }
+  }
+  return values[k];
+}
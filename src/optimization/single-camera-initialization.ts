@@ -104,6 +104,7 @@ function initializeViaCoplanarity(
   verbose: boolean
 ): number {
   let count = 0;
+  const singleCameraSet = new Set(singleCameraPoints);
 
   for (const constraint of constraints) {
     if (!(constraint instanceof CoplanarPointsConstraint)) continue;
@@ -121,7 +122,7 @@ function initializeViaCoplanarity(
     // For each unsolved point in this constraint, use ray-plane intersection
     for (const point of coplanarPoints) {
       if (initializedPoints.has(point)) continue;
-      if (!singleCameraPoints.includes(point)) continue;
+      if (!singleCameraSet.has(point)) continue;
 
       const result = initializePointViaRayPlaneIntersection(point, plane, initializedViewpoints);
       if (result) {
@@ -96,6 +96,91 @@ export class SparseMatrix {
     return new SparseMatrix(rows, cols, rowPointers, colIndices, values);
   }
 
+  /**
+   * Creates a sparse matrix from COO entries stored as parallel arrays
+   * (struct-of-arrays) rather than Triplet objects. Only the first `count`
+   * entries are read. Duplicates are summed; entries whose sum is near zero
+   * are dropped.
+   */
+  static fromCoo(
+    rows: number,
+    cols: number,
+    rowIdx: Int32Array,
+    colIdx: Int32Array,
+    vals: Float64Array,
+    count: number
+  ): SparseMatrix {
+    // Bucket entries by row (counting sort)
+    const rowStart = new Int32Array(rows + 1);
+    for (let k = 0; k < count; k++) {
+      rowStart[rowIdx[k] + 1]++;
+    }
+    for (let row = 0; row < rows; row++) {
+      rowStart[row + 1] += rowStart[row];
+    }
+    const order = new Int32Array(count);
+    const fill = rowStart.slice(0, rows);
+    for (let k = 0; k < count; k++) {
+      order[fill[rowIdx[k]]++] = k;
+    }
+
+    // Merge duplicates within each row using a column -> slot map
+    const slotOfCol = new Int32Array(cols).fill(-1);
+    const rowCols: number[] = [];
+    const rowSums: number[] = [];
+    const rowPointers = new Array<number>(rows + 1);
+    const colIndices: number[] = [];
+    const values: number[] = [];
+
+    for (let row = 0; row < rows; row++) {
+      rowPointers[row] = colIndices.length;
+      rowCols.length = 0;
+      rowSums.length = 0;
+
+      for (let o = rowStart[row]; o < rowStart[row + 1]; o++) {
+        const k = order[o];
+        const col = colIdx[k];
+        const slot = slotOfCol[col];
+        if (slot < 0) {
+          slotOfCol[col] = rowCols.length;
+          rowCols.push(col);
+          rowSums.push(vals[k]);
+        } else {
+          rowSums[slot] += vals[k];
+        }
+      }
+
+      const sortedCols = rowCols.slice().sort((a, b) => a - b);
+      for (const col of sortedCols) {
+        const value = rowSums[slotOfCol[col]];
+        slotOfCol[col] = -1;
+        if (Math.abs(value) > 1e-15) {
+          // Skip near-zero values
+          colIndices.push(col);
+          values.push(value);
+        }
+      }
+    }
+    rowPointers[rows] = colIndices.length;
+
+    return new SparseMatrix(rows, cols, rowPointers, colIndices, values);
+  }
+
+  /**
+   * Creates a sparse matrix directly from CSR arrays (no sorting or merging).
+   * The arrays are used as-is, so a fixed sparsity pattern can be shared by
+   * several matrices that differ only in values.
+   */
+  static fromCsr(
+    rows: number,
+    cols: number,
+    rowPointers: number[],
+    colIndices: number[],
+    values: number[]
+  ): SparseMatrix {
+    return new SparseMatrix(rows, cols, rowPointers, colIndices, values);
+  }
+
   /**
    * Creates a sparse matrix from a dense 2D array.
    */
@@ -238,25 +323,47 @@ export class SparseMatrix {
 
   /**
    * Adds lambda to the diagonal (for Levenberg-Marquardt damping).
-   * Returns a new matrix.
+   * Returns a new matrix. Works on the CSR arrays directly (columns are sorted
+   * within each row), inserting diagonal entries that are not yet present.
    */
   addDiagonal(lambda: number): SparseMatrix {
-    const triplets: Triplet[] = [];
+    const diag = Math.min(this.rows, this.cols);
+    const rowPointers = new Array<number>(this.rows + 1);
+    const colIndices: number[] = [];
+    const values: number[] = [];
+
+    const push = (col: number, value: number) => {
+      if (Math.abs(value) > 1e-15) {
+        // Skip near-zero values
+        colIndices.push(col);
+        values.push(value);
+      }
+    };
 
-    // Copy existing entries
     for (let row = 0; row < this.rows; row++) {
+      rowPointers[row] = colIndices.length;
+      let diagonalPending = row < diag;
+
       for (let idx = this.rowPointers[row]; idx < this.rowPointers[row + 1]; idx++) {
-        triplets.push({ row, col: this.colIndices[idx], value: this.values[idx] });
+        const col = this.colIndices[idx];
+        if (diagonalPending && col >= row) {
+          diagonalPending = false;
+          if (col === row) {
+            push(col, this.values[idx] + lambda);
+            continue;
+          }
+          push(row, lambda);
+        }
+        push(col, this.values[idx]);
       }
-    }
 
-    // Add to diagonal
-    const diag = Math.min(this.rows, this.cols);
-    for (let i = 0; i < diag; i++) {
-      triplets.push({ row: i, col: i, value: lambda });
+      if (diagonalPending) {
+        push(row, lambda);
+      }
     }
+    rowPointers[this.rows] = colIndices.length;
 
-    return SparseMatrix.fromTriplets(this.rows, this.cols, triplets);
+    return new SparseMatrix(this.rows, this.cols, rowPointers, colIndices, values);
   }
 
   /**
@@ -68,6 +68,33 @@ describe('SparseMatrix', () => {
     });
   });
 
+  describe('fromCoo', () => {
+    it('matches fromTriplets for unsorted entries with duplicates', () => {
+      const rowIdx = new Int32Array([1, 0, 0, 1, 0]);
+      const colIdx = new Int32Array([1, 2, 0, 1, 0]);
+      const vals = new Float64Array([3, 2, 1, 4, 5]);
+      const sparse = SparseMatrix.fromCoo(2, 3, rowIdx, colIdx, vals, 5);
+
+      expect(sparse.nonZeroCount).toBe(3);
+      expect(sparse.colIndices).toEqual([0, 2, 1]); // Sorted within each row
+      expect(sparse.get(0, 0)).toBe(6); // 1 + 5
+      expect(sparse.get(0, 2)).toBe(2);
+      expect(sparse.get(1, 1)).toBe(7); // 3 + 4
+    });
+
+    it('ignores entries past count and drops zero sums', () => {
+      const rowIdx = new Int32Array([0, 0, 1, 1]);
+      const colIdx = new Int32Array([0, 0, 1, 0]);
+      const vals = new Float64Array([2, -2, 1, 9]);
+      const sparse = SparseMatrix.fromCoo(2, 2, rowIdx, colIdx, vals, 3);
+
+      expect(sparse.nonZeroCount).toBe(1);
+      expect(sparse.get(0, 0)).toBe(0);
+      expect(sparse.get(1, 0)).toBe(0);
+      expect(sparse.get(1, 1)).toBe(1);
+    });
+  });
+
   describe('identity', () => {
     it('creates identity matrix', () => {
       const I = SparseMatrix.identity(3);
@@ -267,6 +294,23 @@ describe('SparseMatrix', () => {
       expect(B.get(1, 1)).toBe(3);
       expect(B.get(2, 2)).toBe(4);
     });
+
+    it('inserts missing diagonal entries in column order', () => {
+      const A = SparseMatrix.fromDense([
+        [0, 5, 0],
+        [0, 0, 0],
+        [6, 0, 0],
+      ]);
+
+      const B = A.addDiagonal(2);
+
+      expect(B.toDense()).toEqual([
+        [2, 5, 0],
+        [0, 2, 0],
+        [6, 0, 2],
+      ]);
+      expect(B.colIndices).toEqual([0, 1, 1, 0, 2]);
+    });
   });
 
   describe('toDense', () => {
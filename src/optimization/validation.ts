@@ -17,10 +17,16 @@ export function hasPointsField(c: unknown): c is { points: WorldPoint[] } {
  *
  * TIER 1: At least one fully constrained point (locked or inferred).
  * TIER 2: Scale constraint (2+ locked points OR line with targetLength).
+ *
+ * @param knownLockedPoints Fully constrained points the caller has already
+ *   collected from this project; skips re-scanning every world point.
  */
-export function validateProjectConstraints(project: Project): ValidationResult {
-  const worldPointArray = Array.from(project.worldPoints) as WorldPoint[];
-  const lockedPoints = worldPointArray.filter(wp => wp.isFullyConstrained());
+export function validateProjectConstraints(
+  project: Project,
+  knownLockedPoints?: readonly WorldPoint[]
+): ValidationResult {
+  const lockedPoints = knownLockedPoints ??
+    (Array.from(project.worldPoints) as WorldPoint[]).filter(wp => wp.isFullyConstrained());
 
   // TIER 1: Must have at least one fully locked point to anchor the scene
   if (lockedPoints.length === 0) {
@@ -35,10 +41,9 @@ export function validateProjectConstraints(project: Project): ValidationResult {
   }
 
   // TIER 2: Must have scale constraint
-  const hasLengthConstrainedLine = Array.from(project.lines).some(
+  const hasScaleConstraint = lockedPoints.length >= 2 || Array.from(project.lines).some(
     line => line.targetLength !== undefined && line.targetLength > 0
   );
-  const hasScaleConstraint = lockedPoints.length >= 2 || hasLengthConstrainedLine;
 
   if (!hasScaleConstraint) {
     return {
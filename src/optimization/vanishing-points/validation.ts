@@ -156,8 +156,12 @@ export function canInitializeWithVanishingPoints(
     return false
   }
 
-  // Count fully constrained points (all 3 coordinates known via locking or inference)
-  const constrainedCount = Array.from(worldPoints).filter(wp => wp.isFullyConstrained()).length
+  // Count fully constrained points (all 3 coordinates known via locking or inference).
+  // At most 2 are ever needed, so stop counting once that is reached.
+  let constrainedCount = 0
+  for (const wp of worldPoints) {
+    if (wp.isFullyConstrained() && ++constrainedCount >= 2) break
+  }
 
   // Strict mode: require 2+ constrained points
   if (!allowSinglePoint && constrainedCount >= 2) {
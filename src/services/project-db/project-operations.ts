@@ -119,14 +119,8 @@ export async function saveProject(project: Project, folderId?: string | null): P
     }
   }
 
-  const projectCopy = Serialization.deserialize(Serialization.serialize(project))
-  for (const viewpoint of projectCopy.viewpoints) {
-    if (viewpoint.url && viewpoint.url.startsWith('data:')) {
-      viewpoint.url = ''
-    }
-  }
-
-  const projectData = Serialization.serialize(projectCopy)
+  // Images live in the image store, so strip embedded data URLs
+  const projectData = Serialization.serialize(project, { stripDataUrls: true })
 
   // Build thumbnail with geometry overlay
   let thumbnailUrl: string | undefined
@@ -334,9 +328,7 @@ export async function renameProject(id: string, name: string): Promise<void> {
   const db = await openDatabase()
   await getAndUpdateProject(db, id, (storedProject) => {
     // Also update the name in the serialized project data to keep them in sync
-    const projectData = Serialization.deserialize(storedProject.data)
-    projectData.name = name
-    storedProject.data = Serialization.serialize(projectData)
+    storedProject.data = Serialization.renameSerialized(storedProject.data, name)
     storedProject.name = name
     storedProject.updatedAt = new Date()
   })
@@ -360,11 +352,9 @@ export async function copyProject(id: string, newName: string): Promise<string>
         return
       }
 
-      // Deserialize the project data, update the name, and re-serialize
+      // Update the name inside the stored project data as well
       // This ensures both StoredProject.name and the embedded Project.name are in sync
-      const projectData = Serialization.deserialize(original.data)
-      projectData.name = newName
-      const updatedData = Serialization.serialize(projectData)
+      const updatedData = Serialization.renameSerialized(original.data, newName)
 
       const copy: StoredProject = {
         ...original,
@@ -16,13 +16,15 @@ export interface ProjectionResult {
 /**
  * Project a 3D world point to 2D pixel coordinates using a viewpoint's camera.
  * Returns null if the point is behind the camera or projection fails.
+ *
+ * Callers projecting many points through one viewpoint can pass
+ * quaternionToMatrix(viewpoint.rotation) once as rotationMatrix.
  */
 export function projectToPixel(
   worldXyz: [number, number, number],
-  viewpoint: Viewpoint
+  viewpoint: Viewpoint,
+  rotationMatrix: number[][] = quaternionToMatrix(viewpoint.rotation)
 ): ProjectionResult | null {
-  const rotationMatrix = quaternionToMatrix(viewpoint.rotation)
-
   const fx = viewpoint.focalLength
   const fy = viewpoint.focalLength * viewpoint.aspectRatio
   const cx = viewpoint.principalPointX
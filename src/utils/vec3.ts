@@ -46,11 +46,14 @@ export function cross(a: Vec3Array, b: Vec3Array): Vec3Array {
 }
 
 export function distance(a: Vec3Array, b: Vec3Array): number {
-  return magnitude(subtract(a, b))
+  return Math.sqrt(sqrDistance(a, b))
 }
 
 export function sqrDistance(a: Vec3Array, b: Vec3Array): number {
-  return sqrMagnitude(subtract(a, b))
+  const dx = a[0] - b[0]
+  const dy = a[1] - b[1]
+  const dz = a[2] - b[2]
+  return dx * dx + dy * dy + dz * dz
 }
 
 export function midpoint(a: Vec3Array, b: Vec3Array): Vec3Array {